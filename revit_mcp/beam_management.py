@@ -25,8 +25,10 @@ Routes:
 - /place_beams_on_grids/ - Place beams along grid lines
 """
 
+import sys
 import math
 import logging
+from collections import namedtuple
 
 try:
     import clr
@@ -34,7 +36,7 @@ try:
     clr.AddReference("RevitAPIUI")
     from Autodesk.Revit import DB
     from pyrevit import revit, routes
-    from revit_mcp.utils import get_element_name, find_family_symbol_safely
+    from revit_mcp.utils import get_element_name, find_family_symbol_safely, WarningSwallower
 except ImportError as e:
     print("Revit API not available: {}".format(e))
     DB = None
@@ -44,6 +46,213 @@ except ImportError as e:
 # Configure logging
 logger = logging.getLogger(__name__)
 
+try:
+    _intern = intern  # IronPython / Python 2 builtin
+except NameError:
+    _intern = sys.intern
+
+# Parameters reported under "parameters" by get_beam_details
+_DETAIL_PARAM_NAMES = (
+    "Mark", "Comments", "Type Comments", "Type Mark",
+    "Phasing Created", "Phasing Demolished", "Start Extension", "End Extension",
+    "Start Level Offset", "End Level Offset", "Reference Level"
+)
+
+# Type parameters reported by _extract_beam_type_properties, per section
+_DIMENSION_PARAM_NAMES = (
+    # Steel beam dimensions
+    "d", "bf", "tf", "tw", "r", "k", "k1", "T", "kdes", "kdet",
+    "Web Height", "Flange Width", "Flange Thickness", "Web Thickness",
+    # Concrete beam dimensions
+    "b", "h", "Width", "Height", "Depth",
+    # Timber beam dimensions
+    "Nominal Width", "Nominal Depth", "Actual Width", "Actual Depth",
+    # General section properties
+    "Cross-Sectional Area", "Moment of Inertia Ix", "Moment of Inertia Iy",
+    "Section Modulus Sx", "Section Modulus Sy", "Radius of Gyration ix", "Radius of Gyration iy",
+    "Warping Constant", "Torsional Constant", "Perimeter", "Weight per Unit Length",
+    # Composite properties
+    "Effective Width", "Effective Depth", "Composite Area"
+)
+# Metric conversion factor per dimension parameter; names not listed are
+# reported unconverted to three decimals
+_CONVERSION_TABLE = dict(
+    # Linear dimensions, ft to mm
+    [(name, 304.8) for name in (
+        "d", "bf", "tf", "tw", "r", "k", "k1", "T", "kdes", "kdet",
+        "Web Height", "Flange Width", "Flange Thickness", "Web Thickness",
+        "b", "h", "Width", "Height", "Depth",
+        "Nominal Width", "Nominal Depth", "Actual Width", "Actual Depth",
+        "Effective Width", "Effective Depth"
+    )] + [
+        ("Cross-Sectional Area", 645.16),  # sq ft to sq mm
+        ("Composite Area", 645.16),
+        ("Moment of Inertia Ix", 4.162314e6),  # in^4 to mm^4
+        ("Moment of Inertia Iy", 4.162314e6),
+        ("Section Modulus Sx", 16387.064),  # in^3 to mm^3
+        ("Section Modulus Sy", 16387.064),
+        ("Radius of Gyration ix", 25.4),  # in to mm
+        ("Radius of Gyration iy", 25.4),
+        ("Weight per Unit Length", 1.48816),  # lb/ft to kg/m
+    ]
+)
+_MATERIAL_PARAM_NAMES = ("Material", "Structural Material", "Material: Identity Data")
+_STRUCTURAL_PARAM_NAMES = (
+    "Structural Usage", "Structural Material", "Young's Modulus", "Poisson Ratio",
+    "Shear Modulus", "Thermal Expansion Coefficient", "Unit Weight", "Damping Ratio",
+    "Allowable Stress", "Yield Strength", "Ultimate Strength", "Modulus of Elasticity"
+)
+_IDENTITY_PARAM_NAMES = (
+    "Type Name", "Type Comments", "Type Mark", "Type Image", "Description",
+    "Assembly Code", "Assembly Description", "Keynote", "Model", "Manufacturer",
+    "Cost", "URL", "Fire Rating", "Grade", "Standard"
+)
+_ANALYTICAL_PARAM_NAMES = (
+    "Analytical Alignment Method", "Start Extension", "End Extension",
+    "Analytical Model", "Enable Analytical Model", "Release Start", "Release End",
+    "Cantilever", "Continuous"
+)
+# Built-in type parameters never reported under additional_parameters
+_SKIP_TYPE_PARAMS = frozenset(["Element ID", "Type ID", "Family Name", "Type Name", "Category"])
+# Metric conversion factor per material/structural parameter
+_MATERIAL_CONVERSIONS = {
+    "Density": 16.0185,  # lb/ft^3 to kg/m^3
+    "Unit Weight": 16.0185,
+    "Allowable Stress": 0.00689476,  # psi to MPa
+    "Compressive Strength": 0.00689476,
+    "Tensile Strength": 0.00689476,
+    "Yield Strength": 0.00689476,
+    "Ultimate Strength": 0.00689476,
+    "Young's Modulus": 0.00689476,
+    "Modulus of Elasticity": 0.00689476,
+}
+# Material parameters reported by _extract_material_properties
+_MATERIAL_PROP_PARAM_NAMES = (
+    "Young's Modulus", "Poisson Ratio", "Shear Modulus", "Density",
+    "Thermal Expansion Coefficient", "Damping Ratio", "Unit Weight",
+    "Compressive Strength", "Tensile Strength", "Yield Strength",
+    "Ultimate Strength", "Modulus of Elasticity"
+)
+
+# Millimetres to Revit internal feet, applied as a single multiplication
+_FT_PER_MM = 1.0 / 304.8
+
+# Integer id of the Structural Framing category and the parameter storage
+# types, resolved once at import
+if DB is not None:
+    _OST_STRUCT_FRAMING = int(DB.BuiltInCategory.OST_StructuralFraming)
+    _ST_STRING = DB.StorageType.String
+    _ST_INTEGER = DB.StorageType.Integer
+    _ST_DOUBLE = DB.StorageType.Double
+    _ST_ELEMENT_ID = DB.StorageType.ElementId
+    _BASIS_Z = DB.XYZ.BasisZ
+    # Structural usage names mapped to the integer values the parameter stores
+    _USAGE_MAP_INT = {
+        "Beam": int(DB.Structure.StructuralInstanceUsage.Beam),
+        "Girder": int(DB.Structure.StructuralInstanceUsage.Girder),
+        "Joist": int(DB.Structure.StructuralInstanceUsage.Joist),
+        "Other": int(DB.Structure.StructuralInstanceUsage.Other)
+    }
+else:
+    _OST_STRUCT_FRAMING = None
+    _ST_STRING = _ST_INTEGER = _ST_DOUBLE = _ST_ELEMENT_ID = None
+    _BASIS_Z = None
+    _USAGE_MAP_INT = {}
+
+# Rotation angles in radians keyed by degrees rounded to 0.01
+_ANG_CACHE = {}
+
+# Shared stand-in for "no properties"; never mutated, copy before adding keys
+_EMPTY_DICT = {}
+
+# A custom layout beam shaped ahead of the transaction by _prepare_layout_beams
+_PreparedBeam = namedtuple("_PreparedBeam", "index curve symbol structural_usage properties")
+
+# Beams per transaction in create_beam_layout before the next chunk starts
+_LAYOUT_CHUNK_SIZE = 50
+
+# Response keys derived from parameter names by _nk
+_NORM_KEY_CACHE = {}
+
+# Family symbols keyed by (document, family, type) and material properties
+# keyed by (document, material id); both are cleared by _clear_caches at the
+# start of every request that uses them
+_SYMBOL_CACHE = {}
+_MATERIAL_PROPS_CACHE = {}
+
+
+def _clear_caches():
+    """Drop per-request lookups so each request sees the current document"""
+    _SYMBOL_CACHE.clear()
+    _MATERIAL_PROPS_CACHE.clear()
+
+
+class _LayoutTransaction(object):
+    """
+    Chunked transactions for a beam layout, assimilated into one undo record
+    
+    Beams are created inside a TransactionGroup. Every chunk_size beams the
+    open transaction is committed and a new one started, so very large
+    layouts never build up a single huge transaction.
+    """
+    
+    def __init__(self, doc, name, chunk_size=None):
+        self.doc = doc
+        self.name = name
+        self.chunk_size = chunk_size or _LAYOUT_CHUNK_SIZE
+        self.group = DB.TransactionGroup(doc, name)
+        self.trans = None
+    
+    def __enter__(self):
+        self.group.Start()
+        self._begin()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, tb):
+        if self.group.HasStarted() and not self.group.HasEnded():
+            self.rollback()
+        return False
+    
+    def _begin(self):
+        trans = DB.Transaction(self.doc, self.name)
+        # Per-beam warnings are dismissed for the whole batch instead
+        # of being reported one by one
+        failure_options = trans.GetFailureHandlingOptions()
+        failure_options.SetFailuresPreprocessor(WarningSwallower())
+        trans.SetFailureHandlingOptions(failure_options)
+        trans.Start()
+        self.trans = trans
+    
+    def next_beam(self, index):
+        """Commit the current chunk before beam index once it is full"""
+        if index and index % self.chunk_size == 0:
+            self.trans.Commit()
+            self._begin()
+    
+    def commit(self):
+        self.trans.Commit()
+        self.group.Assimilate()
+    
+    def rollback(self):
+        if self.trans is not None and self.trans.HasStarted() and not self.trans.HasEnded():
+            self.trans.RollBack()
+        self.group.RollBack()
+
+
+def _routes(api, paths, **kwargs):
+    """Register one handler under several paths with a single decorator"""
+    def decorator(func):
+        for path in paths:
+            api.route(path, **kwargs)(func)
+        return func
+    return decorator
+
+
+def _is_beam(e, _cat=_OST_STRUCT_FRAMING):
+    """Return True if the element belongs to the Structural Framing category"""
+    cat = getattr(e, "Category", None)
+    return cat is not None and cat.Id.Value == _cat
+
 
 def register_beam_management_routes(api):
     """Register all beam management routes with the API"""
@@ -56,8 +265,7 @@ def register_beam_management_routes(api):
     logger.info("Beam management routes registered successfully")
 
 
-    @api.route("/create_or_edit_beam/", methods=["POST"])
-    @api.route("/create_or_edit_beam", methods=["POST"])
+    @_routes(api, ["/create_or_edit_beam/", "/create_or_edit_beam"], methods=["POST"])
     def create_or_edit_beam():
         """
         Create a new structural beam or edit an existing one
@@ -90,6 +298,8 @@ def register_beam_management_routes(api):
                     data={"error": "No active Revit document"}, status=503
                 )
             
+            _clear_caches()
+            
             # Get request data
             data = routes.get_request_json()
             if not data:
@@ -115,7 +325,7 @@ def register_beam_management_routes(api):
             structural_usage = data.get("structural_usage", "Beam")
             height_offset = data.get("height_offset", 0.0)
             rotation = data.get("rotation", 0.0)
-            properties = data.get("properties", {})
+            properties = data.get("properties") or _EMPTY_DICT
             
             # Validate point data
             for point_name, point_data in [("start_point", start_point), ("end_point", end_point)]:
@@ -137,16 +347,8 @@ def register_beam_management_routes(api):
                         )
                     
                     # Convert points from mm to feet
-                    start_pt = DB.XYZ(
-                        start_point["x"] / 304.8,
-                        start_point["y"] / 304.8,
-                        (start_point["z"] + height_offset) / 304.8
-                    )
-                    end_pt = DB.XYZ(
-                        end_point["x"] / 304.8,
-                        end_point["y"] / 304.8,
-                        (end_point["z"] + height_offset) / 304.8
-                    )
+                    start_pt = DB.XYZ(*_point_to_feet(start_point, height_offset))
+                    end_pt = DB.XYZ(*_point_to_feet(end_point, height_offset))
                     
                     # Create curve for beam
                     if start_pt.IsAlmostEqualTo(end_pt):
@@ -174,20 +376,19 @@ def register_beam_management_routes(api):
                     
                 except Exception as e:
                     trans.RollBack()
-                    logger.error("Failed to create/edit beam: {}".format(str(e)))
+                    logger.error("Failed to create/edit beam: %s", e)
                     return routes.make_response(
                         data={"error": "Failed to create/edit beam: {}".format(str(e))}, status=500
                     )
         
         except Exception as e:
-            logger.error("Error in create_or_edit_beam: {}".format(str(e)))
+            logger.error("Error in create_or_edit_beam: %s", e)
             return routes.make_response(
                 data={"error": "Internal server error: {}".format(str(e))}, status=500
             )
 
 
-    @api.route("/place_beam_between_points/", methods=["POST"])
-    @api.route("/place_beam_between_points", methods=["POST"])
+    @_routes(api, ["/place_beam_between_points/", "/place_beam_between_points"], methods=["POST"])
     def place_beam_between_points():
         """
         Place a structural beam between two specific points
@@ -243,14 +444,13 @@ def register_beam_management_routes(api):
             return _create_beam_from_data(beam_data)
             
         except Exception as e:
-            logger.error("Error in place_beam_between_points: {}".format(str(e)))
+            logger.error("Error in place_beam_between_points: %s", e)
             return routes.make_response(
                 data={"error": "Internal server error: {}".format(str(e))}, status=500
             )
 
 
-    @api.route("/query_beam/", methods=["GET"])
-    @api.route("/query_beam", methods=["GET"])
+    @_routes(api, ["/query_beam/", "/query_beam"], methods=["GET"])
     def query_beam():
         """
         Query basic information about a structural beam by element ID
@@ -284,8 +484,7 @@ def register_beam_management_routes(api):
                     )
                 
                 # Verify it's a structural framing element
-                if not (hasattr(element, 'Category') and element.Category and 
-                    element.Category.Id.Value == int(DB.BuiltInCategory.OST_StructuralFraming)):
+                if not _is_beam(element):
                     return routes.make_response(
                         data={"error": "Element {} is not a structural framing element".format(element_id)}, status=400
                     )
@@ -310,16 +509,15 @@ def register_beam_management_routes(api):
                 )
         
         except Exception as e:
-            logger.error("Error in query_beam: {}".format(str(e)))
+            logger.error("Error in query_beam: %s", e)
             return routes.make_response(
                 data={"error": "Internal server error: {}".format(str(e))}, status=500
             )
 
 
-    @api.route("/get_beam_details/", methods=["GET"])
-    @api.route("/get_beam_details", methods=["GET"])
-    @api.route("/beam_details/", methods=["GET"])
-    @api.route("/beam_details", methods=["GET"])
+    @_routes(api, [
+        "/get_beam_details/", "/get_beam_details", "/beam_details/", "/beam_details"
+    ], methods=["GET"])
     def get_beam_details():
         """
         Get comprehensive information about selected structural beam elements in Revit
@@ -332,6 +530,17 @@ def register_beam_management_routes(api):
         - Structural usage and material properties
         - Cross-sectional properties and dimensions
         - All relevant parameters and properties
+        
+        Sections that come back empty (no structural properties, no matching
+        parameters, no bounding box) are omitted from a beam's entry rather
+        than sent as {} or null, which keeps large selections compact.
+        
+        Query parameters:
+        - include_bbox: "true" to add each beam's bounding box (default "false").
+          Bounding boxes require geometry regeneration and are the most
+          expensive per-beam call, so they are only computed on request.
+        - include_type_properties: "false" to skip the detailed type property
+          extraction (default "true")
         """
         try:
             doc = revit.doc
@@ -342,6 +551,12 @@ def register_beam_management_routes(api):
                     data={"error": "No active Revit document"}, status=503
                 )
             
+            _clear_caches()
+            
+            args = routes.get_request_args() or {}
+            include_bbox = str(args.get("include_bbox", "false")).lower() == "true"
+            include_type_properties = str(args.get("include_type_properties", "true")).lower() != "false"
+            
             # Get selected element IDs
             selection = uidoc.Selection
             selected_ids = selection.GetElementIds()
@@ -356,6 +571,8 @@ def register_beam_management_routes(api):
                 )
             
             beams_info = []
+            # Beams of the same type share one type property extraction
+            type_properties_by_id = {}
             
             for elem_id in selected_ids:
                 try:
@@ -364,8 +581,7 @@ def register_beam_management_routes(api):
                         continue
                     
                     # Check if element is a structural framing element (beam)
-                    if not (hasattr(element, 'Category') and element.Category and 
-                        element.Category.Id.Value == int(DB.BuiltInCategory.OST_StructuralFraming)):
+                    if not _is_beam(element):
                         continue
                     
                     beam_info = {
@@ -379,21 +595,24 @@ def register_beam_management_routes(api):
                         if symbol:
                             beam_info["family_name"] = get_element_name(symbol.Family)
                             beam_info["type_name"] = get_element_name(symbol)
-                            beam_info["type_id"] = str(symbol.Id.Value)
+                            type_id = symbol.Id.Value
+                            beam_info["type_id"] = str(type_id)
                             
                             # Get detailed type properties
-                            type_properties = _extract_beam_type_properties(symbol)
-                            beam_info["type_properties"] = type_properties
+                            if include_type_properties:
+                                type_properties = type_properties_by_id.get(type_id)
+                                if type_properties is None:
+                                    type_properties = _extract_beam_type_properties(symbol)
+                                    type_properties_by_id[type_id] = type_properties
+                                beam_info["type_properties"] = type_properties
                         else:
                             beam_info["family_name"] = "Unknown"
                             beam_info["type_name"] = "Unknown"
                             beam_info["type_id"] = "Unknown"
-                            beam_info["type_properties"] = {}
                     except Exception as e:
                         beam_info["family_name"] = "Unknown"
                         beam_info["type_name"] = "Unknown"
                         beam_info["type_id"] = "Unknown"
-                        beam_info["type_properties"] = {}
                         beam_info["type_error"] = str(e)
                     
                     # ============ LOCATION INFORMATION ============
@@ -473,7 +692,6 @@ def register_beam_management_routes(api):
                             beam_info["height_offset"] = 0.0
                             
                     except Exception as e:
-                        beam_info["level"] = None
                         beam_info["height_offset"] = 0.0
                         beam_info["level_error"] = str(e)
                     
@@ -498,35 +716,30 @@ def register_beam_management_routes(api):
                                         "id": str(material_id.Value)
                                     }
                         
-                        beam_info["structural_properties"] = structural_props
+                        if structural_props:
+                            beam_info["structural_properties"] = structural_props
                         
                     except Exception as e:
-                        beam_info["structural_properties"] = {}
                         beam_info["structural_error"] = str(e)
                     
                     # ============ ADDITIONAL PARAMETERS ============
                     additional_params = {}
-                    param_names = [
-                        "Mark", "Comments", "Type Comments", "Type Mark",
-                        "Phasing Created", "Phasing Demolished", "Start Extension", "End Extension",
-                        "Start Level Offset", "End Level Offset", "Reference Level"
-                    ]
                     
-                    for param_name in param_names:
+                    for param_name in _DETAIL_PARAM_NAMES:
                         try:
                             param = element.LookupParameter(param_name)
                             if param and param.HasValue:
-                                if param.StorageType == DB.StorageType.String:
+                                if param.StorageType == _ST_STRING:
                                     value = param.AsString()
-                                elif param.StorageType == DB.StorageType.Integer:
+                                elif param.StorageType == _ST_INTEGER:
                                     value = param.AsInteger()
-                                elif param.StorageType == DB.StorageType.Double:
+                                elif param.StorageType == _ST_DOUBLE:
                                     # Convert length parameters to mm
                                     if "offset" in param_name.lower() or "extension" in param_name.lower():
                                         value = round(param.AsDouble() * 304.8, 2)
                                     else:
                                         value = round(param.AsDouble(), 3)
-                                elif param.StorageType == DB.StorageType.ElementId:
+                                elif param.StorageType == _ST_ELEMENT_ID:
                                     elem_id_val = param.AsElementId()
                                     if elem_id_val and elem_id_val.Value != -1:
                                         ref_elem = doc.GetElement(elem_id_val)
@@ -541,33 +754,33 @@ def register_beam_management_routes(api):
                         except:
                             continue
                     
-                    beam_info["parameters"] = additional_params
+                    if additional_params:
+                        beam_info["parameters"] = additional_params
                     
                     # ============ BOUNDING BOX ============
-                    try:
-                        bbox = element.get_BoundingBox(None)
-                        if bbox:
-                            beam_info["bounding_box"] = {
-                                "min": {
-                                    "x": round(bbox.Min.X * 304.8, 2),
-                                    "y": round(bbox.Min.Y * 304.8, 2),
-                                    "z": round(bbox.Min.Z * 304.8, 2)
-                                },
-                                "max": {
-                                    "x": round(bbox.Max.X * 304.8, 2),
-                                    "y": round(bbox.Max.Y * 304.8, 2),
-                                    "z": round(bbox.Max.Z * 304.8, 2)
+                    if include_bbox:
+                        try:
+                            bbox = element.get_BoundingBox(None)
+                            if bbox:
+                                beam_info["bounding_box"] = {
+                                    "min": {
+                                        "x": round(bbox.Min.X * 304.8, 2),
+                                        "y": round(bbox.Min.Y * 304.8, 2),
+                                        "z": round(bbox.Min.Z * 304.8, 2)
+                                    },
+                                    "max": {
+                                        "x": round(bbox.Max.X * 304.8, 2),
+                                        "y": round(bbox.Max.Y * 304.8, 2),
+                                        "z": round(bbox.Max.Z * 304.8, 2)
+                                    }
                                 }
-                            }
-                        else:
-                            beam_info["bounding_box"] = None
-                    except:
-                        beam_info["bounding_box"] = None
+                        except:
+                            pass
                     
                     beams_info.append(beam_info)
                     
                 except Exception as e:
-                    logger.warning("Could not process beam element {}: {}".format(elem_id, str(e)))
+                    logger.warning("Could not process beam element %s: %s", elem_id, e)
                     continue
             
             # Prepare response
@@ -581,7 +794,7 @@ def register_beam_management_routes(api):
             return routes.make_response(data=response_data, status=200)
             
         except Exception as e:
-            logger.error("Failed to get beam details: {}".format(str(e)))
+            logger.error("Failed to get beam details: %s", e)
             return routes.make_response(
                 data={
                     "error": "Failed to retrieve beam details: {}".format(str(e))
@@ -590,8 +803,7 @@ def register_beam_management_routes(api):
             )
 
 
-    @api.route("/create_beam_layout/", methods=["POST"])
-    @api.route("/create_beam_layout", methods=["POST"])
+    @_routes(api, ["/create_beam_layout/", "/create_beam_layout"], methods=["POST"])
     def create_beam_layout():
         """
         Create multiple beams in a layout pattern
@@ -610,103 +822,153 @@ def register_beam_management_routes(api):
             ],
             "family_name": "W-Wide Flange",  // Default family for all beams
             "structural_usage": "Beam",  // Default usage
-            "naming_pattern": "B{}"  // Pattern for auto-naming (optional)
+            "naming_pattern": "B{}",  // Pattern for auto-naming (optional)
+            "verbose": false  // Full per-beam details instead of id and length (optional)
+        }
+        
+        For "grid" layouts, beam_configs may be replaced by grid lines:
+        {
+            "layout_type": "grid",
+            "level_name": "Level 1",
+            "x_positions": [0, 6000, 12000],  // mm
+            "y_positions": [0, 8000],  // mm
+            "z_level": 3000,  // mm (optional, default 0)
+            "type_name": "W12X26"  // Type for every grid beam (optional)
         }
+        One beam is placed along each bay between consecutive positions in
+        both directions.
         """
-    try:
-        doc = revit.doc
-        if not doc:
-            return routes.make_response(
-                data={"error": "No active Revit document"}, status=503
-            )
+        try:
+            doc = revit.doc
+            if not doc:
+                return routes.make_response(
+                    data={"error": "No active Revit document"}, status=503
+                )
         
-        data = routes.get_request_json()
-        if not data:
-            return routes.make_response(
-                data={"error": "No JSON data provided"}, status=400
-            )
+            _clear_caches()
         
-        # Validate required parameters
-        required_params = ["level_name", "beam_configs"]
-        for param in required_params:
-            if param not in data:
+            data = routes.get_request_json()
+            if not data:
                 return routes.make_response(
-                    data={"error": "Missing required parameter: {}".format(param)}, status=400
+                    data={"error": "No JSON data provided"}, status=400
                 )
         
-        beam_configs = data["beam_configs"]
-        if not isinstance(beam_configs, list) or len(beam_configs) == 0:
-            return routes.make_response(
-                data={"error": "beam_configs must be a non-empty list"}, status=400
+            is_grid = (
+                data.get("layout_type") == "grid"
+                and "x_positions" in data and "y_positions" in data
             )
         
-        # Extract common parameters
-        level_name = data["level_name"]
-        family_name = data.get("family_name", "W-Wide Flange")
-        structural_usage = data.get("structural_usage", "Beam")
-        naming_pattern = data.get("naming_pattern", "B{}")
+            # Validate required parameters
+            required_params = ["level_name"] if is_grid else ["level_name", "beam_configs"]
+            for param in required_params:
+                if param not in data:
+                    return routes.make_response(
+                        data={"error": "Missing required parameter: {}".format(param)}, status=400
+                    )
         
-        # Start transaction
-        with DB.Transaction(doc, "Create Beam Layout") as trans:
-            trans.Start()
-            
-            try:
-                created_beams = []
-                
-                for i, beam_config in enumerate(beam_configs):
+            # Extract common parameters
+            level_name = data["level_name"]
+            family_name = data.get("family_name", "W-Wide Flange")
+            structural_usage = data.get("structural_usage", "Beam")
+            naming_pattern = data.get("naming_pattern", "B{}")
+            verbose = bool(data.get("verbose", False))
+        
+            # Every beam in the layout is placed on this level
+            layout_level = _find_level_by_name(doc, level_name)
+            if not layout_level:
+                return routes.make_response(
+                    data={"error": "Level '{}' not found".format(level_name)}, status=404
+                )
+        
+            if is_grid:
+                try:
+                    layout_points = _grid_layout_points(
+                        data["x_positions"], data["y_positions"], data.get("z_level", 0.0)
+                    )
+                except (TypeError, ValueError):
+                    return routes.make_response(
+                        data={"error": "x_positions, y_positions and z_level must be numbers in mm"}, status=400
+                    )
+                if not layout_points:
+                    return routes.make_response(
+                        data={"error": "x_positions and y_positions must describe at least one bay"}, status=400
+                    )
+        
+                # The symbol is shared by every grid beam
+                grid_symbol = _get_symbol_cached(doc, family_name, data.get("type_name"))
+                if not grid_symbol:
+                    return routes.make_response(
+                        data={"error": "Could not find beam family '{}' type '{}'".format(
+                            family_name, data.get("type_name") or "default"
+                        )}, status=404
+                    )
+                beam_configs = None
+                requested_count = len(layout_points)
+            else:
+                beam_configs = data["beam_configs"]
+                if not isinstance(beam_configs, list) or len(beam_configs) == 0:
+                    return routes.make_response(
+                        data={"error": "beam_configs must be a non-empty list"}, status=400
+                    )
+                requested_count = len(beam_configs)
+        
+                # Convert every endpoint to feet up front
+                layout_points = []
+                for beam_config in beam_configs:
                     try:
-                        # Prepare beam data
-                        beam_data = {
-                            "level_name": level_name,
-                            "start_point": beam_config.get("start_point"),
-                            "end_point": beam_config.get("end_point"),
-                            "family_name": beam_config.get("family_name", family_name),
-                            "type_name": beam_config.get("type_name"),
-                            "structural_usage": beam_config.get("structural_usage", structural_usage),
-                            "properties": beam_config.get("properties", {})
-                        }
-                        
-                        # Auto-generate mark if not provided
-                        if "mark" not in beam_data["properties"] and "mark" not in beam_config:
-                            if "{}" in naming_pattern:
-                                beam_data["properties"]["Mark"] = naming_pattern.format(i + 1)
-                        elif "mark" in beam_config:
-                            beam_data["properties"]["Mark"] = beam_config["mark"]
-                        
-                        # Create beam
-                        result = _create_beam_from_data_internal(doc, beam_data)
-                        if result.get("success"):
-                            created_beams.append(result)
-                        
-                    except Exception as e:
-                        logger.warning("Failed to create beam {}: {}".format(i + 1, str(e)))
-                        continue
+                        layout_points.append((
+                            _point_to_feet(beam_config["start_point"]),
+                            _point_to_feet(beam_config["end_point"])
+                        ))
+                    except (KeyError, TypeError):
+                        layout_points.append(None)
+        
+            # Build every beam line before the transaction opens, so the
+            # creation loop below only places instances
+            layout_curves = _layout_curves(layout_points)
+            if beam_configs is not None:
+                prepared_beams = _prepare_layout_beams(
+                    doc, beam_configs, layout_curves, family_name, structural_usage, naming_pattern
+                )
+        
+            # Start transaction
+            with _LayoutTransaction(doc, "Create Beam Layout") as layout_trans:
+                try:
+                    if beam_configs is None:
+                        created_beams = _create_grid_beams(
+                            doc, layout_trans, layout_curves, layout_level, grid_symbol,
+                            structural_usage, naming_pattern, verbose
+                        )
+                    else:
+                        created_beams = _create_prepared_beams(
+                            doc, layout_trans, prepared_beams, layout_level, verbose
+                        )
                 
-                trans.Commit()
+                    layout_trans.commit()
                 
-                response_data = {
-                    "message": "Successfully created {} beams out of {} requested".format(
-                        len(created_beams), len(beam_configs)
-                    ),
-                    "created_count": len(created_beams),
-                    "requested_count": len(beam_configs),
-                    "beams": created_beams
-                }
+                    response_data = {
+                        "message": "Successfully created {} beams out of {} requested".format(
+                            len(created_beams), requested_count
+                        ),
+                        "created_count": len(created_beams),
+                        "requested_count": requested_count,
+                        "beams": created_beams
+                    }
                 
-                return routes.make_response(data=response_data, status=200)
+                    return routes.make_response(data=response_data, status=200)
                 
-            except Exception as e:
-                trans.RollBack()
-                logger.error("Failed to create beam layout: {}".format(str(e)))
-                return routes.make_response(
-                    data={"error": "Failed to create beam layout: {}".format(str(e))}, status=500
-                )
+                except Exception as e:
+                    layout_trans.rollback()
+                    logger.error("Failed to create beam layout: %s", e)
+                    return routes.make_response(
+                        data={"error": "Failed to create beam layout: {}".format(str(e))}, status=500
+                    )
     
-    except Exception as e:
-        logger.error("Error in create_beam_layout: {}".format(str(e)))
-        return routes.make_response(
-            data={"error": "Internal server error: {}".format(str(e))}, status=500
-        )
+        except Exception as e:
+            logger.error("Error in create_beam_layout: %s", e)
+            return routes.make_response(
+                data={"error": "Internal server error: {}".format(str(e))}, status=500
+            )
 
 
 # ============ HELPER FUNCTIONS ============
@@ -723,16 +985,232 @@ def _find_level_by_name(doc, level_name):
         return None
 
 
-def _create_new_beam(doc, beam_curve, level, family_name, type_name, structural_usage, rotation, properties):
-    """Create a new structural beam"""
-    try:
-        # Find beam family symbol
+def _get_symbol_cached(doc, family_name, type_name):
+    """Find a structural framing symbol, reusing earlier lookups in this request"""
+    key = (doc.GetHashCode(), family_name, type_name)
+    symbol = _SYMBOL_CACHE.get(key)
+    if symbol is None or not symbol.IsValidObject:
         symbol = find_family_symbol_safely(doc, family_name, type_name, DB.BuiltInCategory.OST_StructuralFraming)
-        if not symbol:
-            return {"error": "Could not find beam family '{}' type '{}'".format(family_name, type_name or "default")}
+        if symbol is None:
+            return None
+        _SYMBOL_CACHE[key] = symbol
+    return symbol
+
+
+def _point_to_feet(point, z_offset=0.0):
+    """Convert an {x, y, z} point in mm to an (x, y, z) tuple in feet"""
+    return (
+        point["x"] * _FT_PER_MM,
+        point["y"] * _FT_PER_MM,
+        (point["z"] + z_offset) * _FT_PER_MM
+    )
+
+
+def _grid_layout_points(x_positions, y_positions, z_level=0.0):
+    """
+    Build ((x, y, z), (x, y, z)) endpoint pairs in feet for a grid layout
+    
+    Positions are in mm. Every bay between consecutive x positions gets a
+    beam on each y line, and every bay between consecutive y positions gets a
+    beam on each x line.
+    """
+    xs = [float(x) * _FT_PER_MM for x in x_positions]
+    ys = [float(y) * _FT_PER_MM for y in y_positions]
+    z = float(z_level) * _FT_PER_MM
+    
+    points = []
+    for y in ys:
+        for x0, x1 in zip(xs, xs[1:]):
+            points.append(((x0, y, z), (x1, y, z)))
+    for x in xs:
+        for y0, y1 in zip(ys, ys[1:]):
+            points.append(((x, y0, z), (x, y1, z)))
+    return points
+
+
+def _split_naming_pattern(naming_pattern):
+    """Split a "B{}" style mark pattern into (prefix, suffix), or None without a placeholder"""
+    if "{}" not in naming_pattern:
+        return None
+    return tuple(naming_pattern.split("{}", 1))
+
+
+def _create_grid_beams(doc, layout_trans, layout_curves, level, symbol, structural_usage, naming_pattern,
+                       verbose=False):
+    """
+    Place one beam per prepared line inside the caller's _LayoutTransaction
+    
+    Lines, level and symbol are all prepared by the caller, so the loop only
+    places the instance and sets usage and mark. Results are compact
+    {element_id, length} entries unless verbose is set.
+    """
+    if not symbol.IsActive:
+        symbol.Activate()
+        doc.Regenerate()
+    
+    new_instance = doc.Create.NewFamilyInstance
+    beam_type = DB.Structure.StructuralType.Beam
+    mark_parts = _split_naming_pattern(naming_pattern)
+    family_name = get_element_name(symbol.Family)
+    type_name = get_element_name(symbol)
+    
+    created_beams = []
+    for i, beam_curve in enumerate(layout_curves):
+        layout_trans.next_beam(i)
+        if beam_curve is None:
+            logger.warning("Skipping beam %d: start and end points coincide", i + 1)
+            continue
+        sub = DB.SubTransaction(doc)
+        sub.Start()
+        try:
+            beam = new_instance(beam_curve, symbol, level, beam_type)
+            if structural_usage:
+                _set_structural_usage(beam, structural_usage)
+            if mark_parts:
+                _set_beam_properties(beam, {"Mark": "".join((mark_parts[0], str(i + 1), mark_parts[1]))})
+            sub.Commit()
+            if not verbose:
+                created_beams.append({
+                    "element_id": str(beam.Id.Value),
+                    "length": round(beam_curve.Length * 304.8, 2)
+                })
+                continue
+            created_beams.append({
+                "success": True,
+                "message": "Successfully created beam '{}'".format(get_element_name(beam)),
+                "element_id": str(beam.Id.Value),
+                "element_type": "beam",
+                "family_name": family_name,
+                "type_name": type_name,
+                "length": round(beam_curve.Length * 304.8, 2)
+            })
+        except Exception as e:
+            if sub.HasStarted() and not sub.HasEnded():
+                sub.RollBack()
+            logger.warning("Failed to create beam %d: %s", i + 1, e)
+    return created_beams
+
+
+def _prepare_layout_beams(doc, beam_configs, layout_curves, family_name, structural_usage, naming_pattern):
+    """
+    Shape custom layout configs into _PreparedBeam records
+    
+    All pure-Python work (defaults, marks, symbol resolution) happens here,
+    before the layout transaction opens. Configs without a valid line or a
+    known family type are skipped with a warning.
+    """
+    symbols = {}
+    mark_parts = _split_naming_pattern(naming_pattern)
+    prepared_beams = []
+    for i, beam_config in enumerate(beam_configs):
+        beam_curve = layout_curves[i]
+        if beam_curve is None:
+            logger.warning("Skipping beam %d: invalid start_point/end_point", i + 1)
+            continue
         
-        # Ensure symbol is active
+        symbol_key = (beam_config.get("family_name", family_name), beam_config.get("type_name"))
+        if symbol_key in symbols:
+            symbol = symbols[symbol_key]
+        else:
+            symbol = _get_symbol_cached(doc, symbol_key[0], symbol_key[1])
+            symbols[symbol_key] = symbol
+        if symbol is None:
+            logger.warning("Skipping beam %d: family '%s' type '%s' not found",
+                           i + 1, symbol_key[0], symbol_key[1] or "default")
+            continue
+        
+        properties = beam_config.get("properties") or _EMPTY_DICT
+        
+        # Auto-generate mark if not provided
+        if "mark" not in properties and "mark" not in beam_config:
+            if mark_parts:
+                properties = dict(properties)
+                properties["Mark"] = "".join((mark_parts[0], str(i + 1), mark_parts[1]))
+        elif "mark" in beam_config:
+            properties = dict(properties)
+            properties["Mark"] = beam_config["mark"]
+        
+        prepared_beams.append(_PreparedBeam(
+            i, beam_curve, symbol,
+            beam_config.get("structural_usage", structural_usage),
+            properties
+        ))
+    return prepared_beams
+
+
+def _create_prepared_beams(doc, layout_trans, prepared_beams, level, verbose=False):
+    """
+    Place prepared beams inside the caller's _LayoutTransaction
+    
+    Every distinct symbol is activated first so the document regenerates at
+    most once. Each beam then runs in its own SubTransaction, so a failed
+    beam only rolls back its own changes. Results are compact
+    {element_id, length} entries unless verbose is set.
+    """
+    needs_regenerate = False
+    for symbol in set(beam.symbol for beam in prepared_beams):
         if not symbol.IsActive:
+            symbol.Activate()
+            needs_regenerate = True
+    if needs_regenerate:
+        doc.Regenerate()
+    
+    created_beams = []
+    for n, beam in enumerate(prepared_beams):
+        layout_trans.next_beam(n)
+        sub = DB.SubTransaction(doc)
+        sub.Start()
+        result = _create_new_beam(
+            doc, beam.curve, level, None, None, beam.structural_usage, 0.0, beam.properties,
+            symbol=beam.symbol, pre_activated=True
+        )
+        if result.get("success"):
+            sub.Commit()
+            if verbose:
+                created_beams.append(result)
+            else:
+                created_beams.append({"element_id": result["element_id"], "length": result["length"]})
+        else:
+            sub.RollBack()
+            logger.warning("Failed to create beam %d: %s", beam.index + 1, result.get("error"))
+    return created_beams
+
+
+def _layout_curves(layout_points):
+    """Build a bound line per (start, end) pair in feet, None where the pair is missing or degenerate"""
+    XYZ = DB.XYZ
+    create_bound = DB.Line.CreateBound
+    curves = []
+    for points_ft in layout_points:
+        if points_ft is None:
+            curves.append(None)
+            continue
+        try:
+            curves.append(create_bound(XYZ(*points_ft[0]), XYZ(*points_ft[1])))
+        except Exception:
+            curves.append(None)
+    return curves
+
+
+def _create_new_beam(doc, beam_curve, level, family_name, type_name, structural_usage, rotation, properties,
+                     symbol=None, pre_activated=False):
+    """
+    Create a new structural beam
+    
+    Runs inside the caller's open transaction and never starts its own, so a
+    layout of many beams shares a single undo record. A caller that already
+    holds the symbol passes it in to skip the lookup, and sets pre_activated
+    once it has activated it and regenerated the document itself.
+    """
+    try:
+        if symbol is None:
+            # Find beam family symbol
+            symbol = _get_symbol_cached(doc, family_name, type_name)
+            if not symbol:
+                return {"error": "Could not find beam family '{}' type '{}'".format(family_name, type_name or "default")}
+        
+        # Ensure symbol is active
+        if not pre_activated and not symbol.IsActive:
             symbol.Activate()
             doc.Regenerate()
         
@@ -764,12 +1242,12 @@ def _create_new_beam(doc, beam_curve, level, family_name, type_name, structural_
         }
         
     except Exception as e:
-        logger.error("Failed to create new beam: {}".format(str(e)))
+        logger.error("Failed to create new beam: %s", e)
         return {"error": "Failed to create beam: {}".format(str(e))}
 
 
 def _edit_existing_beam(doc, element_id, beam_curve, level, family_name, type_name, structural_usage, rotation, properties):
-    """Edit an existing structural beam"""
+    """Edit an existing structural beam inside the caller's open transaction"""
     try:
         # Get existing beam
         elem_id = DB.ElementId(int(element_id))
@@ -780,18 +1258,23 @@ def _edit_existing_beam(doc, element_id, beam_curve, level, family_name, type_na
             return _create_new_beam(doc, beam_curve, level, family_name, type_name, structural_usage, rotation, properties)
         
         # Verify it's a structural framing element
-        if not (hasattr(beam, 'Category') and beam.Category and 
-               beam.Category.Id.Value == int(DB.BuiltInCategory.OST_StructuralFraming)):
+        if not _is_beam(beam):
             return {"error": "Element is not a structural framing element"}
         
-        # Update beam curve (location)
-        if hasattr(beam.Location, 'Curve'):
-            beam.Location.Curve = beam_curve
+        # Update beam curve (location); every assignment below is skipped when
+        # the value is unchanged, since each one makes Revit regenerate joins
+        location = beam.Location
+        if hasattr(location, 'Curve'):
+            current = location.Curve
+            if not (current
+                    and current.GetEndPoint(0).IsAlmostEqualTo(beam_curve.GetEndPoint(0))
+                    and current.GetEndPoint(1).IsAlmostEqualTo(beam_curve.GetEndPoint(1))):
+                location.Curve = beam_curve
         
         # Update family/type if specified
         if family_name or type_name:
-            symbol = find_family_symbol_safely(doc, family_name, type_name, DB.BuiltInCategory.OST_StructuralFraming)
-            if symbol:
+            symbol = _get_symbol_cached(doc, family_name, type_name)
+            if symbol and beam.Symbol.Id != symbol.Id:
                 if not symbol.IsActive:
                     symbol.Activate()
                     doc.Regenerate()
@@ -799,7 +1282,7 @@ def _edit_existing_beam(doc, element_id, beam_curve, level, family_name, type_na
         
         # Update level
         level_param = beam.get_Parameter(DB.BuiltInParameter.INSTANCE_REFERENCE_LEVEL_PARAM)
-        if level_param:
+        if level_param and level_param.AsElementId() != level.Id:
             level_param.Set(level.Id)
         
         # Set structural usage
@@ -827,24 +1310,19 @@ def _edit_existing_beam(doc, element_id, beam_curve, level, family_name, type_na
         # Invalid element ID, create new beam instead
         return _create_new_beam(doc, beam_curve, level, family_name, type_name, structural_usage, rotation, properties)
     except Exception as e:
-        logger.error("Failed to edit beam: {}".format(str(e)))
+        logger.error("Failed to edit beam: %s", e)
         return {"error": "Failed to edit beam: {}".format(str(e))}
 
 
 def _set_structural_usage(beam, structural_usage):
     """Set structural usage for a beam"""
     try:
+        usage_value = _USAGE_MAP_INT.get(structural_usage)
+        if usage_value is None:
+            return
         usage_param = beam.get_Parameter(DB.BuiltInParameter.INSTANCE_STRUCT_USAGE_PARAM)
         if usage_param:
-            usage_map = {
-                "Beam": DB.Structure.StructuralInstanceUsage.Beam,
-                "Girder": DB.Structure.StructuralInstanceUsage.Girder,
-                "Joist": DB.Structure.StructuralInstanceUsage.Joist,
-                "Other": DB.Structure.StructuralInstanceUsage.Other
-            }
-            
-            if structural_usage in usage_map:
-                usage_param.Set(int(usage_map[structural_usage]))
+            usage_param.Set(usage_value)
     except:
         pass
 
@@ -852,12 +1330,15 @@ def _set_structural_usage(beam, structural_usage):
 def _apply_beam_rotation(beam, rotation_degrees):
     """Apply rotation to a beam"""
     try:
-        if hasattr(beam.Location, 'Curve'):
-            curve = beam.Location.Curve
-            midpoint = curve.Evaluate(0.5, True)
-            axis = DB.Line.CreateBound(midpoint, midpoint + DB.XYZ.BasisZ)
-            angle = math.radians(rotation_degrees)
-            beam.Location.Rotate(axis, angle)
+        location = beam.Location
+        if hasattr(location, 'Curve'):
+            midpoint = location.Curve.Evaluate(0.5, True)
+            axis = DB.Line.CreateBound(midpoint, midpoint + _BASIS_Z)
+            key = round(rotation_degrees, 2)
+            angle = _ANG_CACHE.get(key)
+            if angle is None:
+                angle = _ANG_CACHE[key] = math.radians(key)
+            location.Rotate(axis, angle)
     except:
         pass
 
@@ -871,11 +1352,12 @@ def _set_beam_properties(beam, properties):
         try:
             param = beam.LookupParameter(prop_name)
             if param and not param.IsReadOnly:
-                if param.StorageType == DB.StorageType.String:
+                storage_type = param.StorageType
+                if storage_type == _ST_STRING:
                     param.Set(str(prop_value))
-                elif param.StorageType == DB.StorageType.Integer:
+                elif storage_type == _ST_INTEGER:
                     param.Set(int(prop_value))
-                elif param.StorageType == DB.StorageType.Double:
+                elif storage_type == _ST_DOUBLE:
                     param.Set(float(prop_value))
         except:
             continue
@@ -890,6 +1372,8 @@ def _create_beam_from_data(beam_data):
                 data={"error": "No active Revit document"}, status=503
             )
         
+        _clear_caches()
+        
         with DB.Transaction(doc, "Create Structural Beam") as trans:
             trans.Start()
             
@@ -899,13 +1383,13 @@ def _create_beam_from_data(beam_data):
                 return routes.make_response(data=result, status=200)
             except Exception as e:
                 trans.RollBack()
-                logger.error("Failed to create beam: {}".format(str(e)))
+                logger.error("Failed to create beam: %s", e)
                 return routes.make_response(
                     data={"error": "Failed to create beam: {}".format(str(e))}, status=500
                 )
     
     except Exception as e:
-        logger.error("Error in _create_beam_from_data: {}".format(str(e)))
+        logger.error("Error in _create_beam_from_data: %s", e)
         return routes.make_response(
             data={"error": "Internal server error: {}".format(str(e))}, status=500
         )
@@ -920,16 +1404,8 @@ def _create_beam_from_data_internal(doc, beam_data):
             return {"error": "Level '{}' not found".format(beam_data["level_name"])}
         
         # Convert points
-        start_pt = DB.XYZ(
-            beam_data["start_point"]["x"] / 304.8,
-            beam_data["start_point"]["y"] / 304.8,
-            beam_data["start_point"]["z"] / 304.8
-        )
-        end_pt = DB.XYZ(
-            beam_data["end_point"]["x"] / 304.8,
-            beam_data["end_point"]["y"] / 304.8,
-            beam_data["end_point"]["z"] / 304.8
-        )
+        start_pt = DB.XYZ(*_point_to_feet(beam_data["start_point"]))
+        end_pt = DB.XYZ(*_point_to_feet(beam_data["end_point"]))
         
         # Create curve
         beam_curve = DB.Line.CreateBound(start_pt, end_pt)
@@ -941,11 +1417,11 @@ def _create_beam_from_data_internal(doc, beam_data):
             beam_data.get("type_name"),
             beam_data.get("structural_usage", "Beam"),
             beam_data.get("rotation", 0.0),
-            beam_data.get("properties", {})
+            beam_data.get("properties") or _EMPTY_DICT
         )
         
     except Exception as e:
-        logger.error("Failed to create beam from data: {}".format(str(e)))
+        logger.error("Failed to create beam from data: %s", e)
         return {"error": "Failed to create beam: {}".format(str(e))}
 
 
@@ -1005,7 +1481,7 @@ def _extract_beam_config(beam):
         for param_name in ["Mark", "Comments"]:
             param = beam.LookupParameter(param_name)
             if param and param.HasValue:
-                if param.StorageType == DB.StorageType.String:
+                if param.StorageType == _ST_STRING:
                     additional_params[param_name] = param.AsString()
         
         config["properties"] = additional_params
@@ -1013,10 +1489,32 @@ def _extract_beam_config(beam):
         return config
         
     except Exception as e:
-        logger.error("Failed to extract beam config: {}".format(str(e)))
+        logger.error("Failed to extract beam config: %s", e)
         raise
 
 
+def _nk(name):
+    """Normalise a parameter name into a response key, memoized per name"""
+    key = _NORM_KEY_CACHE.get(name)
+    if key is None:
+        key = name.lower().replace("'", "").replace(" ", "_").replace(":", "")
+        _NORM_KEY_CACHE[name] = key
+    return key
+
+
+def _index_parameters(element):
+    """
+    Map parameter names to parameters in one pass, keeping the first match like LookupParameter
+    
+    Each name crosses the .NET boundary once and is interned, so the section
+    lookups and set tests that follow compare identical string objects.
+    """
+    by_name = {}
+    for param in element.Parameters:
+        by_name.setdefault(_intern(param.Definition.Name), param)
+    return by_name
+
+
 def _extract_beam_type_properties(symbol):
     """Extract comprehensive type properties from a beam family symbol"""
     try:
@@ -1027,64 +1525,30 @@ def _extract_beam_type_properties(symbol):
         type_properties["family_name"] = get_element_name(symbol.Family)
         type_properties["category"] = symbol.Category.Name if symbol.Category else "Unknown"
         
+        # Every section below reads from this one pass over symbol.Parameters
+        by_name = _index_parameters(symbol)
+        # Names reported by a section, left out of additional_parameters
+        captured_names = set()
+        
         # ============ DIMENSIONAL PROPERTIES ============
         dimensions = {}
         
-        # Common structural beam dimension parameters
-        dimension_param_names = [
-            # Steel beam dimensions
-            "d", "bf", "tf", "tw", "r", "k", "k1", "T", "kdes", "kdet",
-            "Web Height", "Flange Width", "Flange Thickness", "Web Thickness",
-            # Concrete beam dimensions  
-            "b", "h", "Width", "Height", "Depth",
-            # Timber beam dimensions
-            "Nominal Width", "Nominal Depth", "Actual Width", "Actual Depth",
-            # General section properties
-            "Cross-Sectional Area", "Moment of Inertia Ix", "Moment of Inertia Iy",
-            "Section Modulus Sx", "Section Modulus Sy", "Radius of Gyration ix", "Radius of Gyration iy",
-            "Warping Constant", "Torsional Constant", "Perimeter", "Weight per Unit Length",
-            # Composite properties
-            "Effective Width", "Effective Depth", "Composite Area"
-        ]
-        
-        for param_name in dimension_param_names:
-            try:
-                param = symbol.LookupParameter(param_name)
+        try:
+            for param_name in _DIMENSION_PARAM_NAMES:
+                param = by_name.get(param_name)
                 if param and param.HasValue:
-                    if param.StorageType == DB.StorageType.Double:
+                    captured_names.add(param_name)
+                    if param.StorageType == _ST_DOUBLE:
                         # Convert based on parameter type
                         value = param.AsDouble()
-                        if param_name in ["d", "bf", "tf", "tw", "r", "k", "k1", "T", "kdes", "kdet", 
-                                         "Web Height", "Flange Width", "Flange Thickness", "Web Thickness",
-                                         "b", "h", "Width", "Height", "Depth",
-                                         "Nominal Width", "Nominal Depth", "Actual Width", "Actual Depth",
-                                         "Effective Width", "Effective Depth"]:
-                            # Linear dimensions - convert to mm
-                            dimensions[param_name] = round(value * 304.8, 2)
-                        elif param_name in ["Cross-Sectional Area", "Composite Area"]:
-                            # Area - convert to sq mm
-                            dimensions[param_name] = round(value * 645.16, 2)  # sq ft to sq mm
-                        elif param_name in ["Moment of Inertia Ix", "Moment of Inertia Iy"]:
-                            # Moment of inertia - convert to mm^4
-                            dimensions[param_name] = round(value * 4.162314e6, 2)  # in^4 to mm^4
-                        elif param_name in ["Section Modulus Sx", "Section Modulus Sy"]:
-                            # Section modulus - convert to mm^3
-                            dimensions[param_name] = round(value * 16387.064, 2)  # in^3 to mm^3
-                        elif param_name in ["Radius of Gyration ix", "Radius of Gyration iy"]:
-                            # Radius of gyration - convert to mm
-                            dimensions[param_name] = round(value * 25.4, 2)  # in to mm
-                        elif param_name in ["Weight per Unit Length"]:
-                            # Weight per unit length - convert to kg/m
-                            dimensions[param_name] = round(value * 1.48816, 2)  # lb/ft to kg/m
-                        else:
-                            # Other values
-                            dimensions[param_name] = round(value, 3)
-                    elif param.StorageType == DB.StorageType.Integer:
+                        factor = _CONVERSION_TABLE.get(param_name)
+                        dimensions[param_name] = round(value * factor, 2) if factor else round(value, 3)
+                    elif param.StorageType == _ST_INTEGER:
                         dimensions[param_name] = param.AsInteger()
-                    elif param.StorageType == DB.StorageType.String:
+                    elif param.StorageType == _ST_STRING:
                         dimensions[param_name] = param.AsString()
-            except:
-                continue
+        except Exception as e:
+            logger.debug("Could not read dimension parameters: %s", e)
         
         type_properties["dimensions"] = dimensions
         
@@ -1108,116 +1572,93 @@ def _extract_beam_type_properties(symbol):
             pass
         
         # Get other material parameters
-        material_param_names = ["Material", "Structural Material", "Material: Identity Data"]
-        
-        for param_name in material_param_names:
-            try:
-                param = symbol.LookupParameter(param_name)
+        try:
+            for param_name in _MATERIAL_PARAM_NAMES:
+                param = by_name.get(param_name)
                 if param and param.HasValue:
-                    if param.StorageType == DB.StorageType.ElementId:
+                    captured_names.add(param_name)
+                    if param.StorageType == _ST_ELEMENT_ID:
                         elem_id = param.AsElementId()
                         if elem_id and elem_id.Value != -1:
                             material = symbol.Document.GetElement(elem_id)
                             if material:
-                                materials[param_name.lower().replace(":", "").replace(" ", "_")] = {
+                                materials[_nk(param_name)] = {
                                     "name": get_element_name(material),
                                     "id": str(elem_id.Value)
                                 }
-                    elif param.StorageType == DB.StorageType.String:
-                        materials[param_name.lower().replace(":", "").replace(" ", "_")] = param.AsString()
-            except:
-                continue
+                    elif param.StorageType == _ST_STRING:
+                        materials[_nk(param_name)] = param.AsString()
+        except Exception as e:
+            logger.debug("Could not read material parameters: %s", e)
         
         type_properties["materials"] = materials
         
         # ============ STRUCTURAL PROPERTIES ============
         structural = {}
         
-        structural_param_names = [
-            "Structural Usage", "Structural Material", "Young's Modulus", "Poisson Ratio", 
-            "Shear Modulus", "Thermal Expansion Coefficient", "Unit Weight", "Damping Ratio",
-            "Allowable Stress", "Yield Strength", "Ultimate Strength", "Modulus of Elasticity"
-        ]
-        
-        for param_name in structural_param_names:
-            try:
-                param = symbol.LookupParameter(param_name)
+        try:
+            for param_name in _STRUCTURAL_PARAM_NAMES:
+                param = by_name.get(param_name)
                 if param and param.HasValue:
-                    if param.StorageType == DB.StorageType.String:
-                        structural[param_name.lower().replace("'", "").replace(" ", "_")] = param.AsString()
-                    elif param.StorageType == DB.StorageType.Double:
+                    captured_names.add(param_name)
+                    if param.StorageType == _ST_STRING:
+                        structural[_nk(param_name)] = param.AsString()
+                    elif param.StorageType == _ST_DOUBLE:
                         value = param.AsDouble()
-                        if param_name == "Unit Weight":
-                            # Convert to kg/m³
-                            structural[param_name.lower().replace(" ", "_")] = round(value * 16.0185, 2)  # lb/ft³ to kg/m³
-                        elif param_name in ["Allowable Stress", "Yield Strength", "Ultimate Strength"]:
-                            # Convert to MPa
-                            structural[param_name.lower().replace(" ", "_")] = round(value * 0.00689476, 2)  # psi to MPa
-                        elif param_name in ["Young's Modulus", "Modulus of Elasticity"]:
-                            # Convert to MPa
-                            structural[param_name.lower().replace("'", "").replace(" ", "_")] = round(value * 0.00689476, 2)
-                        else:
-                            structural[param_name.lower().replace("'", "").replace(" ", "_")] = round(value, 3)
-                    elif param.StorageType == DB.StorageType.Integer:
-                        structural[param_name.lower().replace("'", "").replace(" ", "_")] = param.AsInteger()
-                    elif param.StorageType == DB.StorageType.ElementId:
+                        factor = _MATERIAL_CONVERSIONS.get(param_name)
+                        structural[_nk(param_name)] = (
+                            round(value * factor, 2) if factor else round(value, 3)
+                        )
+                    elif param.StorageType == _ST_INTEGER:
+                        structural[_nk(param_name)] = param.AsInteger()
+                    elif param.StorageType == _ST_ELEMENT_ID:
                         elem_id = param.AsElementId()
                         if elem_id and elem_id.Value != -1:
                             elem = symbol.Document.GetElement(elem_id)
-                            structural[param_name.lower().replace(" ", "_")] = get_element_name(elem) if elem else str(elem_id.Value)
-            except:
-                continue
+                            structural[_nk(param_name)] = get_element_name(elem) if elem else str(elem_id.Value)
+        except Exception as e:
+            logger.debug("Could not read structural parameters: %s", e)
         
         type_properties["structural"] = structural
         
         # ============ IDENTITY DATA ============
         identity = {}
         
-        identity_param_names = [
-            "Type Name", "Type Comments", "Type Mark", "Type Image", "Description", 
-            "Assembly Code", "Assembly Description", "Keynote", "Model", "Manufacturer", 
-            "Cost", "URL", "Fire Rating", "Grade", "Standard"
-        ]
-        
-        for param_name in identity_param_names:
-            try:
-                param = symbol.LookupParameter(param_name)
+        try:
+            for param_name in _IDENTITY_PARAM_NAMES:
+                param = by_name.get(param_name)
                 if param and param.HasValue:
-                    if param.StorageType == DB.StorageType.String:
+                    captured_names.add(param_name)
+                    if param.StorageType == _ST_STRING:
                         value = param.AsString()
                         if value and value.strip():
-                            identity[param_name.lower().replace(" ", "_")] = value.strip()
-                    elif param.StorageType == DB.StorageType.Double:
-                        identity[param_name.lower().replace(" ", "_")] = round(param.AsDouble(), 2)
-                    elif param.StorageType == DB.StorageType.Integer:
-                        identity[param_name.lower().replace(" ", "_")] = param.AsInteger()
-            except:
-                continue
+                            identity[_nk(param_name)] = value.strip()
+                    elif param.StorageType == _ST_DOUBLE:
+                        identity[_nk(param_name)] = round(param.AsDouble(), 2)
+                    elif param.StorageType == _ST_INTEGER:
+                        identity[_nk(param_name)] = param.AsInteger()
+        except Exception as e:
+            logger.debug("Could not read identity parameters: %s", e)
         
         type_properties["identity"] = identity
         
         # ============ ANALYTICAL PROPERTIES ============
         analytical = {}
         
-        analytical_param_names = [
-            "Analytical Alignment Method", "Start Extension", "End Extension",
-            "Analytical Model", "Enable Analytical Model", "Release Start", "Release End",
-            "Cantilever", "Continuous"
-        ]
-        
-        for param_name in analytical_param_names:
-            try:
-                param = symbol.LookupParameter(param_name)
+        try:
+            for param_name in _ANALYTICAL_PARAM_NAMES:
+                param = by_name.get(param_name)
                 if param and param.HasValue:
-                    if param.StorageType == DB.StorageType.String:
-                        analytical[param_name.lower().replace(" ", "_")] = param.AsString()
-                    elif param.StorageType == DB.StorageType.Double:
+                    captured_names.add(param_name)
+                    if param.StorageType == _ST_STRING:
+                        analytical[_nk(param_name)] = param.AsString()
+                    elif param.StorageType == _ST_DOUBLE:
                         # Convert extensions to mm
-                        analytical[param_name.lower().replace(" ", "_")] = round(param.AsDouble() * 304.8, 2)
-                    elif param.StorageType == DB.StorageType.Integer:
-                        analytical[param_name.lower().replace(" ", "_")] = param.AsInteger()
-            except:
-                continue
+                        analytical[_nk(param_name)] = round(param.AsDouble() * 304.8, 2)
+                    elif param.StorageType == _ST_INTEGER:
+                        analytical[_nk(param_name)] = param.AsInteger()
+        except Exception as e:
+            logger.debug("Could not read analytical parameters: %s", e)
         
         type_properties["analytical"] = analytical
         
@@ -1226,45 +1667,35 @@ def _extract_beam_type_properties(symbol):
         
         # Get all parameters not already captured
         try:
-            for param in symbol.Parameters:
-                param_name = param.Definition.Name
-                
-                # Skip if already captured in other sections
-                if any(param_name in section.values() if isinstance(section, dict) else False 
-                       for section in [dimensions, materials, structural, identity, analytical]):
-                    continue
-                
-                # Skip built-in parameters that are not useful
-                skip_params = ["Element ID", "Type ID", "Family Name", "Type Name", "Category"]
-                if param_name in skip_params:
+            for param_name, param in by_name.items():
+                # Skip parameters already captured in other sections and
+                # built-in parameters that are not useful
+                if param_name in captured_names or param_name in _SKIP_TYPE_PARAMS:
                     continue
                 
-                try:
-                    if param.HasValue:
-                        if param.StorageType == DB.StorageType.String:
-                            value = param.AsString()
-                            if value and value.strip():
-                                additional[param_name.lower().replace(" ", "_")] = value.strip()
-                        elif param.StorageType == DB.StorageType.Double:
-                            additional[param_name.lower().replace(" ", "_")] = round(param.AsDouble(), 3)
-                        elif param.StorageType == DB.StorageType.Integer:
-                            additional[param_name.lower().replace(" ", "_")] = param.AsInteger()
-                        elif param.StorageType == DB.StorageType.ElementId:
-                            elem_id = param.AsElementId()
-                            if elem_id and elem_id.Value != -1:
-                                elem = symbol.Document.GetElement(elem_id)
-                                additional[param_name.lower().replace(" ", "_")] = get_element_name(elem) if elem else str(elem_id.Value)
-                except:
-                    continue
-        except:
-            pass
+                if param.HasValue:
+                    if param.StorageType == _ST_STRING:
+                        value = param.AsString()
+                        if value and value.strip():
+                            additional[_nk(param_name)] = value.strip()
+                    elif param.StorageType == _ST_DOUBLE:
+                        additional[_nk(param_name)] = round(param.AsDouble(), 3)
+                    elif param.StorageType == _ST_INTEGER:
+                        additional[_nk(param_name)] = param.AsInteger()
+                    elif param.StorageType == _ST_ELEMENT_ID:
+                        elem_id = param.AsElementId()
+                        if elem_id and elem_id.Value != -1:
+                            elem = symbol.Document.GetElement(elem_id)
+                            additional[_nk(param_name)] = get_element_name(elem) if elem else str(elem_id.Value)
+        except Exception as e:
+            logger.debug("Could not read additional parameters: %s", e)
         
         type_properties["additional_parameters"] = additional
         
         return type_properties
         
     except Exception as e:
-        logger.warning("Could not extract beam type properties: {}".format(str(e)))
+        logger.warning("Could not extract beam type properties: %s", e)
         return {
             "error": str(e),
             "dimensions": {},
@@ -1277,42 +1708,35 @@ def _extract_beam_type_properties(symbol):
 
 
 def _extract_material_properties(material):
-    """Extract material properties from a material element"""
+    """Extract material properties from a material element, once per material per request"""
     try:
+        cache_key = (material.Document.GetHashCode(), material.Id.Value)
+        material_props = _MATERIAL_PROPS_CACHE.get(cache_key)
+        if material_props is not None:
+            return material_props
+        
         material_props = {}
         
-        # Material property parameters
-        prop_param_names = [
-            "Young's Modulus", "Poisson Ratio", "Shear Modulus", "Density", 
-            "Thermal Expansion Coefficient", "Damping Ratio", "Unit Weight",
-            "Compressive Strength", "Tensile Strength", "Yield Strength",
-            "Ultimate Strength", "Modulus of Elasticity"
-        ]
+        by_name = _index_parameters(material)
         
-        for param_name in prop_param_names:
-            try:
-                param = material.LookupParameter(param_name)
+        try:
+            for param_name in _MATERIAL_PROP_PARAM_NAMES:
+                param = by_name.get(param_name)
                 if param and param.HasValue:
-                    if param.StorageType == DB.StorageType.Double:
+                    if param.StorageType == _ST_DOUBLE:
                         value = param.AsDouble()
-                        if param_name in ["Density", "Unit Weight"]:
-                            # Convert to kg/m³
-                            material_props[param_name.lower().replace(" ", "_")] = round(value * 16.0185, 2)
-                        elif param_name in ["Compressive Strength", "Tensile Strength", "Yield Strength", "Ultimate Strength"]:
-                            # Convert to MPa
-                            material_props[param_name.lower().replace(" ", "_")] = round(value * 0.00689476, 2)  # psi to MPa
-                        elif param_name in ["Young's Modulus", "Modulus of Elasticity"]:
-                            # Convert to MPa
-                            material_props[param_name.lower().replace("'", "").replace(" ", "_")] = round(value * 0.00689476, 2)
-                        else:
-                            material_props[param_name.lower().replace("'", "").replace(" ", "_")] = round(value, 3)
-                    elif param.StorageType == DB.StorageType.String:
-                        material_props[param_name.lower().replace("'", "").replace(" ", "_")] = param.AsString()
-            except:
-                continue
+                        factor = _MATERIAL_CONVERSIONS.get(param_name)
+                        material_props[_nk(param_name)] = (
+                            round(value * factor, 2) if factor else round(value, 3)
+                        )
+                    elif param.StorageType == _ST_STRING:
+                        material_props[_nk(param_name)] = param.AsString()
+        except Exception as e:
+            logger.debug("Could not read material property parameters: %s", e)
         
+        _MATERIAL_PROPS_CACHE[cache_key] = material_props
         return material_props
         
     except Exception as e:
-        logger.warning("Could not extract material properties: {}".format(str(e)))
+        logger.warning("Could not extract material properties: %s", e)
         return {"error": str(e)} 
\ No newline at end of file
@@ -4,15 +4,126 @@ Color management functionality for Revit elements
 Provides tools for color splashing elements based on parameter values
 """
 
-from pyrevit import routes, DB
+from pyrevit import routes, DB, HOST_APP
+from System import AppDomain, EventHandler
 import json
 import logging
 import random
+import re
 from collections import defaultdict
 from .utils import normalize_string
 
 logger = logging.getLogger(__name__)
 
+# Revit enum members read per parameter, bound once
+_ST_STRING = DB.StorageType.String
+_ST_INTEGER = DB.StorageType.Integer
+_ST_DOUBLE = DB.StorageType.Double
+_ST_ELEMENT_ID = DB.StorageType.ElementId
+_INVALID_ELEMENT_ID = DB.ElementId.InvalidElementId
+
+# Predefined RGB colors that are visually distinct
+_BASE_COLORS = (
+    (255, 0, 0),  # Red
+    (0, 255, 0),  # Green
+    (0, 0, 255),  # Blue
+    (255, 255, 0),  # Yellow
+    (255, 0, 255),  # Magenta
+    (0, 255, 255),  # Cyan
+    (255, 128, 0),  # Orange
+    (128, 0, 255),  # Purple
+    (255, 128, 128),  # Pink
+    (128, 255, 128),  # Light Green
+    (128, 128, 255),  # Light Blue
+    (255, 255, 128),  # Light Yellow
+    (128, 0, 0),  # Dark Red
+    (0, 128, 0),  # Dark Green
+    (0, 0, 128),  # Dark Blue
+    (128, 128, 0),  # Olive
+    (128, 0, 128),  # Dark Magenta
+    (0, 128, 128),  # Teal
+    (192, 192, 192),  # Silver
+    (128, 128, 128),  # Gray
+    (255, 192, 203),  # Light Pink
+    (255, 165, 0),  # Orange Red
+    (255, 20, 147),  # Deep Pink
+    (50, 205, 50),  # Lime Green
+    (30, 144, 255),  # Dodger Blue
+)
+
+# Base palette scaled per brightness cycle, see _distinct_color_cycles
+_DISTINCT_COLOR_CYCLES = []
+
+# Memoized color conversions, shared across color splash calls
+_HEX_RGB_CACHE = {}
+_RGB_HEX_CACHE = {}
+_COLOR_CACHE_LIMIT = 1024
+
+# Solid fill pattern ElementId per document hash code
+_SOLID_FILL_CACHE = {}
+
+# Failed elements listed in the summary warning of a color or clear request
+_FAILURE_SAMPLE_LIMIT = 10
+
+# Elements cleared per transaction inside the clear request's group
+_CLEAR_BATCH_SIZE = 1000
+
+# Category name -> Category table per document hash code
+_CATEGORY_CACHE = {}
+
+# (document hash code, ViewType) -> non-template views of that type that
+# allow graphics overrides, invalidated from the DocumentChanged handler
+_VIEWS_CACHE = {}
+_CACHED_VIEW_IDS = set()  # id values of every view held in _VIEWS_CACHE
+
+# AppDomain data slots holding the delegates attached to Application events.
+# They outlive a pyRevit reload, so a reloaded module can detach the handlers
+# of its previous copy before attaching its own.
+_EVENT_SLOT_PREFIX = "revit_mcp.colors."
+_DOCUMENT_EVENTS_WATCHED = False
+
+# Yes/No parameter type for the running Revit version: SpecTypeId in newer
+# APIs, ParameterType in older ones
+_YESNO_SPEC_TYPE = getattr(
+    getattr(getattr(DB, "SpecTypeId", None), "Boolean", None), "YesNo", None
+)
+_YESNO_PARAMETER_TYPE = getattr(getattr(DB, "ParameterType", None), "YesNo", None)
+# Definition members are fixed per Revit version, so probe them only once
+_DEFINITION_HAS_DATA_TYPE = hasattr(DB.Definition, "GetDataType")
+_DEFINITION_HAS_PARAMETER_TYPE = hasattr(DB.Definition, "ParameterType")
+
+# Parameter name fragments that switch gradient mode to numeric positions
+_NUMERIC_PARAM_HINTS = (
+    "length",
+    "longueur",
+    "area",
+    "volume",
+    "height",
+    "width",
+    "thickness",
+)
+
+# Patterns used to make parameter values JSON-safe
+_RE_NUMERIC = re.compile(r"^[\d.+-]+$")
+_RE_NONPRINT = re.compile(r"[^\x20-\x7E]")
+_RE_SPECIAL = re.compile(r"[^\w\s\.\-\(\)\/\+\=\:\,]")
+_RE_WS = re.compile(r"\s+")
+# Values made only of characters the patterns above would keep
+_RE_CLEAN_ASCII = re.compile(r"^[A-Za-z0-9_ .()/+=:,-]*$")
+
+# Sort value for non-numeric strings, placing them after all numbers
+_INF = float("inf")
+
+# Leading number followed by an optional unit suffix, e.g. "10.00 m"
+_RE_NUMERIC_PREFIX = re.compile(
+    r"^([-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?)[^\d.+-]*$"
+)
+_FLOAT_CACHE = {}
+_FLOAT_CACHE_LIMIT = 4096
+
+# Six hex digits of an RGB color, ignoring any trailing alpha
+_RE_HEX_RGB = re.compile(r"^[0-9a-f]{6}")
+
 
 def generate_distinct_colors(count):
     """
@@ -27,58 +138,51 @@ def generate_distinct_colors(count):
     if count == 0:
         return []
 
-    # Predefined RGB colors that are visually distinct
-    base_colors = [
-        (255, 0, 0),  # Red
-        (0, 255, 0),  # Green
-        (0, 0, 255),  # Blue
-        (255, 255, 0),  # Yellow
-        (255, 0, 255),  # Magenta
-        (0, 255, 255),  # Cyan
-        (255, 128, 0),  # Orange
-        (128, 0, 255),  # Purple
-        (255, 128, 128),  # Pink
-        (128, 255, 128),  # Light Green
-        (128, 128, 255),  # Light Blue
-        (255, 255, 128),  # Light Yellow
-        (128, 0, 0),  # Dark Red
-        (0, 128, 0),  # Dark Green
-        (0, 0, 128),  # Dark Blue
-        (128, 128, 0),  # Olive
-        (128, 0, 128),  # Dark Magenta
-        (0, 128, 128),  # Teal
-        (192, 192, 192),  # Silver
-        (128, 128, 128),  # Gray
-        (255, 192, 203),  # Light Pink
-        (255, 165, 0),  # Orange Red
-        (255, 20, 147),  # Deep Pink
-        (50, 205, 50),  # Lime Green
-        (30, 144, 255),  # Dodger Blue
-    ]
+    cycles = _distinct_color_cycles()
+    if count <= len(cycles[0]):
+        return list(cycles[0][:count])
 
     colors = []
-    for i in range(count):
-        if i < len(base_colors):
-            # Use predefined colors
-            r, g, b = base_colors[i]
-        else:
-            # Generate additional colors by cycling and modifying
-            base_idx = i % len(base_colors)
-            cycle = i // len(base_colors)
-            r, g, b = base_colors[base_idx]
+    for cycle_colors in cycles:
+        remaining = count - len(colors)
+        if remaining <= 0:
+            break
+        colors.extend(cycle_colors[:remaining])
+
+    # Past the darkest cycle every further cycle repeats the same colors
+    while len(colors) < count:
+        remaining = count - len(colors)
+        colors.extend(cycle_colors[:remaining])
 
-            # Modify brightness to create variations
-            factor = 1.0 - (cycle * 0.15)  # Reduce brightness by 15% each cycle
-            factor = max(0.3, factor)  # Don't go too dark
+    return colors
 
-            r = int(r * factor)
-            g = int(g * factor)
-            b = int(b * factor)
 
-        color = DB.Color(r, g, b)
-        colors.append(color)
+def _distinct_color_cycles():
+    """
+    Get the base palette scaled for each brightness cycle, built once
 
-    return colors
+    The DB.Color objects are shared between calls, so callers must treat
+    them as read-only.
+
+    Returns:
+        list: One tuple of DB.Color objects per cycle, from full brightness
+        down to the darkest cycle
+    """
+    if not _DISTINCT_COLOR_CYCLES:
+        cycle = 0
+        while True:
+            # Reduce brightness by 15% each cycle, without going too dark
+            factor = max(0.3, 1.0 - (cycle * 0.15))
+            _DISTINCT_COLOR_CYCLES.append(
+                tuple(
+                    DB.Color(int(r * factor), int(g * factor), int(b * factor))
+                    for r, g, b in _BASE_COLORS
+                )
+            )
+            if factor == 0.3:
+                break
+            cycle += 1
+    return _DISTINCT_COLOR_CYCLES
 
 
 def generate_gradient_colors(count):
@@ -92,19 +196,38 @@ def generate_gradient_colors(count):
     if count <= 1:
         return [DB.Color(255, 0, 0)]
 
-    colors = []
-    for i in range(count):
-        # Create more distinct gradient from blue to red
-        ratio = float(i) / (count - 1)
+    # Create more distinct gradient from blue to red
+    last = float(count - 1)
+    return [DB.Color(*gradient_rgb(i / last)) for i in range(count)]
+
 
-        # Use HSV color space for better distribution
-        red = int(255 * ratio)
-        green = int(255 * (1 - abs(2 * ratio - 1)))  # Peak at middle
-        blue = int(255 * (1 - ratio))
+def gradient_rgb(position):
+    """
+    Compute the blue to red gradient RGB triple for a position
 
-        colors.append(DB.Color(red, green, blue))
+    The hue is swept in HSV space (blue at 240 degrees down to red at 0)
+    at full saturation and value, which keeps mid-range colors vivid
+    instead of the muddy tones of a straight RGB blend.
 
-    return colors
+    Args:
+        position (float): Position in gradient (0.0 to 1.0)
+
+    Returns:
+        tuple: RGB tuple (r, g, b)
+    """
+    # H' = 6H with H = (1 - position) * 2/3, so H' runs from 4 (blue) to 0 (red)
+    h = (1.0 - position) * 4.0
+    sector = int(h)
+    x = int(255 * (1 - abs(h % 2 - 1)))
+    if sector == 0:
+        return (255, x, 0)
+    elif sector == 1:
+        return (x, 255, 0)
+    elif sector == 2:
+        return (0, 255, x)
+    elif sector == 3:
+        return (0, x, 255)
+    return (x, 0, 255)
 
 
 def interpolate_color(position):
@@ -120,12 +243,8 @@ def interpolate_color(position):
     # Clamp position to valid range
     position = max(0.0, min(1.0, position))
 
-    # Blue to Red gradient with green in middle
-    red = int(255 * position)
-    green = int(255 * (1 - abs(2 * position - 1)))  # Peak at middle
-    blue = int(255 * (1 - position))
-
-    return DB.Color(red, green, blue)
+    # Blue to Red hue sweep through cyan, green and yellow
+    return DB.Color(*gradient_rgb(position))
 
 
 def check_view_compatibility(doc):
@@ -167,20 +286,57 @@ def hex_to_rgb(hex_color):
     Convert hex color string to RGB tuple
 
     Args:
-        hex_color (str): Hex color string (e.g., "#FF0000" or "FF0000")
+        hex_color (str): Hex color string (e.g., "#FF0000", "FF0000" or "#F00")
 
     Returns:
         tuple: RGB tuple (r, g, b)
     """
     # Remove # if present
-    hex_color = hex_color.lstrip("#")
+    hex_color = hex_color.lstrip("#").lower()
 
-    # Convert to RGB
-    try:
-        return tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
-    except (ValueError, IndexError):
+    rgb = _HEX_RGB_CACHE.get(hex_color)
+    if rgb is not None:
+        return rgb
+
+    # Expand shorthand such as "f80" to "ff8800"
+    digits = hex_color
+    if len(digits) == 3:
+        digits = "".join(c + c for c in digits)
+
+    # Convert to RGB with a single parse of the six digits
+    if not _RE_HEX_RGB.match(digits):
         logger.warning("Invalid hex color: %s. Using red as fallback.", hex_color)
         return (255, 0, 0)
+    n = int(digits[:6], 16)
+    rgb = ((n >> 16) & 0xFF, (n >> 8) & 0xFF, n & 0xFF)
+
+    if len(_HEX_RGB_CACHE) >= _COLOR_CACHE_LIMIT:
+        _HEX_RGB_CACHE.clear()
+    _HEX_RGB_CACHE[hex_color] = rgb
+    return rgb
+
+
+def _is_yes_no(definition):
+    """
+    Check whether a parameter Definition is a Yes/No parameter
+
+    Args:
+        definition: Revit parameter Definition
+
+    Returns:
+        bool: True for Yes/No parameters
+    """
+    if _DEFINITION_HAS_DATA_TYPE:
+        return (
+            _YESNO_SPEC_TYPE is not None
+            and definition.GetDataType() == _YESNO_SPEC_TYPE
+        )
+    elif _DEFINITION_HAS_PARAMETER_TYPE:
+        return (
+            _YESNO_PARAMETER_TYPE is not None
+            and definition.ParameterType == _YESNO_PARAMETER_TYPE
+        )
+    return False
 
 
 def get_parameter_value_safe(element, parameter_name):
@@ -198,15 +354,15 @@ def get_parameter_value_safe(element, parameter_name):
         # Try to get parameter by name
         param = element.LookupParameter(parameter_name)
         if param and param.HasValue:
-            if param.StorageType == DB.StorageType.String:
+            if param.StorageType == _ST_STRING:
                 value = param.AsString()
-            elif param.StorageType == DB.StorageType.Integer:
+            elif param.StorageType == _ST_INTEGER:
                 value = str(param.AsInteger())
-            elif param.StorageType == DB.StorageType.Double:
+            elif param.StorageType == _ST_DOUBLE:
                 value = str(round(param.AsDouble(), 2))
-            elif param.StorageType == DB.StorageType.ElementId:
+            elif param.StorageType == _ST_ELEMENT_ID:
                 elem_id = param.AsElementId()
-                if elem_id and elem_id != DB.ElementId.InvalidElementId:
+                if elem_id and elem_id != _INVALID_ELEMENT_ID:
                     value = str(elem_id.Value)
                 else:
                     value = "No Value"
@@ -242,72 +398,63 @@ def get_parameter_value_improved(element, parameter_name):
     """
     try:
         # Try to get parameter by name from element
-        for param in element.Parameters:
-            if param.Definition.Name == parameter_name:
-                if not param.HasValue:
-                    return "None"
-
-                if param.StorageType == DB.StorageType.Double:
-                    return param.AsValueString() or "None"
-                elif param.StorageType == DB.StorageType.ElementId:
-                    id_val = param.AsElementId()
-                    if id_val and id_val != DB.ElementId.InvalidElementId:
-                        try:
-                            elem = element.Document.GetElement(id_val)
-                            if elem and hasattr(elem, "Name"):
-                                return elem.Name or "None"
-                        except:
-                            pass
-                    return "None"
-                elif param.StorageType == DB.StorageType.Integer:
-                    # Handle Yes/No parameters
+        param = element.LookupParameter(parameter_name)
+        if param is not None:
+            if not param.HasValue:
+                return "None"
+
+            if param.StorageType == _ST_DOUBLE:
+                return param.AsValueString() or "None"
+            elif param.StorageType == _ST_ELEMENT_ID:
+                id_val = param.AsElementId()
+                if id_val and id_val != _INVALID_ELEMENT_ID:
                     try:
-                        if hasattr(param.Definition, "GetDataType"):
-                            param_type = param.Definition.GetDataType()
-                            if hasattr(DB, "SpecTypeId") and hasattr(
-                                DB.SpecTypeId, "Boolean"
-                            ):
-                                if param_type == DB.SpecTypeId.Boolean.YesNo:
-                                    return "True" if param.AsInteger() == 1 else "False"
-                        elif hasattr(param.Definition, "ParameterType"):
-                            param_type = param.Definition.ParameterType
-                            if param_type == DB.ParameterType.YesNo:
-                                return "True" if param.AsInteger() == 1 else "False"
-
-                        return param.AsValueString() or str(param.AsInteger())
+                        elem = element.Document.GetElement(id_val)
+                        if elem and hasattr(elem, "Name"):
+                            return elem.Name or "None"
                     except:
-                        return str(param.AsInteger())
-                elif param.StorageType == DB.StorageType.String:
-                    return param.AsString() or "None"
-                else:
-                    return param.AsValueString() or "None"
+                        pass
+                return "None"
+            elif param.StorageType == _ST_INTEGER:
+                # Handle Yes/No parameters
+                try:
+                    if _is_yes_no(param.Definition):
+                        return "True" if param.AsInteger() == 1 else "False"
+
+                    return param.AsValueString() or str(param.AsInteger())
+                except:
+                    return str(param.AsInteger())
+            elif param.StorageType == _ST_STRING:
+                return param.AsString() or "None"
+            else:
+                return param.AsValueString() or "None"
 
         # Try type parameters if not found in instance
         try:
             element_type = element.Document.GetElement(element.GetTypeId())
             if element_type:
-                for param in element_type.Parameters:
-                    if param.Definition.Name == parameter_name:
-                        if not param.HasValue:
-                            return "None"
-
-                        if param.StorageType == DB.StorageType.Double:
-                            return param.AsValueString() or "None"
-                        elif param.StorageType == DB.StorageType.ElementId:
-                            id_val = param.AsElementId()
-                            if id_val and id_val != DB.ElementId.InvalidElementId:
-                                try:
-                                    elem = element.Document.GetElement(id_val)
-                                    if elem and hasattr(elem, "Name"):
-                                        return elem.Name or "None"
-                                except:
-                                    pass
-                        elif param.StorageType == DB.StorageType.Integer:
-                            return param.AsValueString() or str(param.AsInteger())
-                        elif param.StorageType == DB.StorageType.String:
-                            return param.AsString() or "None"
-                        else:
-                            return param.AsValueString() or "None"
+                param = element_type.LookupParameter(parameter_name)
+                if param is not None:
+                    if not param.HasValue:
+                        return "None"
+
+                    if param.StorageType == _ST_DOUBLE:
+                        return param.AsValueString() or "None"
+                    elif param.StorageType == _ST_ELEMENT_ID:
+                        id_val = param.AsElementId()
+                        if id_val and id_val != _INVALID_ELEMENT_ID:
+                            try:
+                                elem = element.Document.GetElement(id_val)
+                                if elem and hasattr(elem, "Name"):
+                                    return elem.Name or "None"
+                            except:
+                                pass
+                    elif param.StorageType == _ST_INTEGER:
+                        return param.AsValueString() or str(param.AsInteger())
+                    elif param.StorageType == _ST_STRING:
+                        return param.AsString() or "None"
+                    else:
+                        return param.AsValueString() or "None"
         except:
             pass
 
@@ -333,18 +480,19 @@ def clean_parameter_value_for_json(param_value):
 
     try:
         value_str = str(param_value)
-        try:
-            if value_str.replace(".", "").replace("-", "").replace("+", "").isdigit():
-                float_val = float(value_str)
-                return "{:.2f}".format(float_val)
-        except (ValueError, TypeError):
-            pass
-        import re
+        if _RE_NUMERIC.match(value_str):
+            try:
+                return "{:.2f}".format(float(value_str))
+            except ValueError:
+                pass
 
-        cleaned = re.sub(r"[^\x20-\x7E]", "", value_str)
+        # Fast path: plain ASCII values that need no character stripping
+        if _RE_CLEAN_ASCII.match(value_str):
+            return " ".join(value_str.split()) or "None"
 
-        cleaned = re.sub(r"[^\w\s\.\-\(\)\/\+\=\:\,]", "", cleaned)
-        cleaned = re.sub(r"\s+", " ", cleaned).strip()
+        cleaned = _RE_NONPRINT.sub("", value_str)
+        cleaned = _RE_SPECIAL.sub("", cleaned)
+        cleaned = _RE_WS.sub(" ", cleaned).strip()
         return cleaned if cleaned else "None"
     except Exception as e:
         logger.debug("Error cleaning parameter value: %s", e)
@@ -374,18 +522,29 @@ def get_parameter_value_json_safe(element, parameter_name):
 
 def safe_color_to_hex(color):
     try:
-        r = max(0, min(255, int(color.Red)))
-        g = max(0, min(255, int(color.Green)))
-        b = max(0, min(255, int(color.Blue)))
-        return "#{:02x}{:02x}{:02x}".format(r, g, b)
+        key = (int(color.Red), int(color.Green), int(color.Blue))
     except Exception:
         return "#FF0000"
 
+    hex_color = _RGB_HEX_CACHE.get(key)
+    if hex_color is None:
+        r, g, b = [max(0, min(255, channel)) for channel in key]
+        hex_color = "#{:02x}{:02x}{:02x}".format(r, g, b)
+        if len(_RGB_HEX_CACHE) >= _COLOR_CACHE_LIMIT:
+            _RGB_HEX_CACHE.clear()
+        _RGB_HEX_CACHE[key] = hex_color
+    return hex_color
+
 
 def solid_fill_pattern_id(doc):
     """
     Get the solid fill pattern ID for the document
 
+    The result is cached per document, so repeated color splashes skip the
+    FillPatternElement scan. The DocumentChanged handler drops it when the
+    pattern is deleted; without that handler it is checked against the
+    document on every call instead.
+
     Args:
         doc: Revit document
 
@@ -393,19 +552,312 @@ def solid_fill_pattern_id(doc):
         DB.ElementId: Solid fill pattern ID, or None if not found
     """
     try:
-        # Get all fill patterns
-        collector = DB.FilteredElementCollector(doc).OfClass(DB.FillPatternElement)
+        doc_key = doc.GetHashCode()
+        cached_id = _SOLID_FILL_CACHE.get(doc_key)
+        if cached_id is not None:
+            if _DOCUMENT_EVENTS_WATCHED:
+                return cached_id
+            cached_elem = doc.GetElement(cached_id)
+            if (
+                isinstance(cached_elem, DB.FillPatternElement)
+                and cached_elem.GetFillPattern().IsSolidFill
+            ):
+                return cached_id
+
+        # Try the standard solid fill by name before scanning all patterns
+        pattern_elem = None
+        try:
+            pattern_elem = DB.FillPatternElement.GetFillPatternElementByName(
+                doc, DB.FillPatternTarget.Drafting, "<Solid fill>"
+            )
+        except Exception:
+            pass
 
-        for pattern_elem in collector:
-            pattern = pattern_elem.GetFillPattern()
-            if pattern.IsSolidFill:
-                return pattern_elem.Id
+        if pattern_elem is None or not pattern_elem.GetFillPattern().IsSolidFill:
+            collector = DB.FilteredElementCollector(doc).OfClass(DB.FillPatternElement)
+            pattern_elem = next(
+                (p for p in collector if p.GetFillPattern().IsSolidFill), None
+            )
 
-        return None
+        if pattern_elem is None:
+            return None
+
+        if not _DOCUMENT_EVENTS_WATCHED:
+            # Closed documents cannot be evicted, so keep only the latest one
+            _SOLID_FILL_CACHE.clear()
+        _SOLID_FILL_CACHE[doc_key] = pattern_elem.Id
+        return pattern_elem.Id
     except Exception:
         return None
 
 
+def find_category(doc, category_name):
+    """
+    Find a document category by name
+
+    The name -> Category table is cached per document and rebuilt when a
+    name is missing from it, so categories added later are still found.
+    A cached hit is resolved again in the document by its id, since the
+    hash code may have been reused by another document.
+
+    Args:
+        doc: Revit document
+        category_name (str): Name of the category
+
+    Returns:
+        DB.Category: Matching category, or None if not found
+    """
+    doc_key = doc.GetHashCode()
+    table = _CATEGORY_CACHE.get(doc_key)
+    if table is not None and category_name in table:
+        try:
+            category = DB.Category.GetCategory(doc, table[category_name].Id)
+            if category is not None and category.Name == category_name:
+                return category
+        except Exception:
+            pass
+
+    table = {}
+    for cat in doc.Settings.Categories:
+        table.setdefault(cat.Name, cat)
+    if not _DOCUMENT_EVENTS_WATCHED:
+        # Closed documents cannot be evicted, so keep only the latest one
+        _CATEGORY_CACHE.clear()
+    _CATEGORY_CACHE[doc_key] = table
+    return table.get(category_name)
+
+
+def _clear_views_cache():
+    _VIEWS_CACHE.clear()
+    _CACHED_VIEW_IDS.clear()
+
+
+def _on_document_changed(sender, args):
+    """
+    Drop only the cached entries that an edit may have invalidated
+
+    Added views change which views match a ViewType; deleted ids are
+    checked against the view and fill pattern ids currently cached.
+    """
+    try:
+        if (
+            _VIEWS_CACHE
+            and args.GetAddedElementIds(DB.ElementClassFilter(DB.View)).Count
+        ):
+            _clear_views_cache()
+
+        deleted_ids = args.GetDeletedElementIds()
+        if not deleted_ids.Count:
+            return
+        deleted_values = set(element_id.Value for element_id in deleted_ids)
+
+        if not _CACHED_VIEW_IDS.isdisjoint(deleted_values):
+            _clear_views_cache()
+        for doc_key, fill_id in list(_SOLID_FILL_CACHE.items()):
+            if fill_id.Value in deleted_values:
+                del _SOLID_FILL_CACHE[doc_key]
+    except Exception:
+        _clear_views_cache()
+        _SOLID_FILL_CACHE.clear()
+
+
+def _on_document_closing(sender, args):
+    """
+    Forget everything cached for a document that is being closed
+
+    Entries are keyed by document hash code, which a document opened later
+    may reuse, so they must not outlive their document.
+    """
+    try:
+        doc_key = args.Document.GetHashCode()
+    except Exception:
+        _clear_views_cache()
+        _SOLID_FILL_CACHE.clear()
+        _CATEGORY_CACHE.clear()
+        return
+
+    _SOLID_FILL_CACHE.pop(doc_key, None)
+    _CATEGORY_CACHE.pop(doc_key, None)
+    if any(cache_key[0] == doc_key for cache_key in _VIEWS_CACHE):
+        _clear_views_cache()
+
+
+def _watch_document_events(application):
+    """
+    Attach the cache handlers to Application events, replacing the ones
+    attached by a previously loaded copy of this module
+
+    Args:
+        application: Revit Application raising the events
+
+    Returns:
+        bool: True if the handlers are attached
+    """
+    global _DOCUMENT_EVENTS_WATCHED
+    try:
+        domain = AppDomain.CurrentDomain
+        for event_name, args_type, handler in (
+            (
+                "DocumentChanged",
+                DB.Events.DocumentChangedEventArgs,
+                _on_document_changed,
+            ),
+            (
+                "DocumentClosing",
+                DB.Events.DocumentClosingEventArgs,
+                _on_document_closing,
+            ),
+        ):
+            slot = _EVENT_SLOT_PREFIX + event_name
+            event = getattr(application, event_name)
+            previous = domain.GetData(slot)
+            if previous is not None:
+                event -= previous
+            delegate = EventHandler[args_type](handler)
+            event += delegate
+            domain.SetData(slot, delegate)
+        _DOCUMENT_EVENTS_WATCHED = True
+    except Exception as e:
+        logger.debug("Could not subscribe to document events: %s", e)
+    return _DOCUMENT_EVENTS_WATCHED
+
+
+def get_views_of_same_type(doc, active_view):
+    """
+    Get the non-template views sharing the active view's ViewType that
+    allow graphics overrides
+
+    The views of each type are cached per document while the document
+    event handlers are attached, and dropped when views are added or a
+    cached view is deleted.
+
+    Args:
+        doc: Revit document
+        active_view: View whose type is matched; it is excluded from the result
+
+    Returns:
+        list: Matching views, empty if they cannot be determined
+    """
+    try:
+        view_type = active_view.ViewType
+    except AttributeError:
+        return []
+
+    try:
+        cache_key = (doc.GetHashCode(), view_type)
+        views = _VIEWS_CACHE.get(cache_key)
+        if views is None:
+            collector = (
+                DB.FilteredElementCollector(doc)
+                .OfClass(DB.View)
+                .WhereElementIsNotElementType()
+            )
+            views = [
+                view
+                for view in collector
+                if not view.IsTemplate
+                and view.ViewType == view_type
+                and view.AreGraphicsOverridesAllowed()
+            ]
+            # Only cache when edits to the document can invalidate the entry
+            if _DOCUMENT_EVENTS_WATCHED:
+                _VIEWS_CACHE[cache_key] = views
+                _CACHED_VIEW_IDS.update(view.Id.Value for view in views)
+
+        active_view_id = active_view.Id
+        return [view for view in views if view.Id != active_view_id]
+    except Exception as e:
+        logger.debug("Error collecting views of the active view type: %s", e)
+        return []
+
+
+def build_override_template(solid_fill_id):
+    """
+    Build the color-independent part of a single color override
+
+    Args:
+        solid_fill_id (DB.ElementId): Solid fill pattern id, or None
+
+    Returns:
+        DB.OverrideGraphicSettings: Settings to copy in build_color_override
+    """
+    template = DB.OverrideGraphicSettings()
+    template.SetProjectionLineWeight(3)  # Make lines more visible
+
+    if solid_fill_id is not None:
+        template.SetSurfaceForegroundPatternId(solid_fill_id)
+        template.SetCutForegroundPatternId(solid_fill_id)
+    return template
+
+
+def build_color_override(color, template):
+    """
+    Build the override settings that paint an element in a single color
+
+    Args:
+        color (DB.Color): Color for lines and surface/cut patterns
+        template (DB.OverrideGraphicSettings): Settings from
+            build_override_template, copied rather than modified
+
+    Returns:
+        DB.OverrideGraphicSettings: Configured override settings
+    """
+    override_settings = DB.OverrideGraphicSettings(template)
+    override_settings.SetProjectionLineColor(color)
+    override_settings.SetSurfaceForegroundPatternColor(color)
+    override_settings.SetCutForegroundPatternColor(color)
+    override_settings.SetCutLineColor(color)
+    return override_settings
+
+
+def apply_element_overrides(
+    active_view, other_views, element_ids, override_settings, failure_samples
+):
+    """
+    Apply override settings to elements in the active view and similar views
+
+    The active view is overridden in one pass; only if that raises are the
+    elements retried one by one so failures can be skipped and reported.
+
+    Args:
+        active_view: View to override first
+        other_views (list): Further views to override on a best-effort basis
+        element_ids (list): Ids of the elements to override
+        override_settings: DB.OverrideGraphicSettings to apply
+        failure_samples (list): Receives (element id, error) for the first
+            failed elements, up to _FAILURE_SAMPLE_LIMIT entries in total
+
+    Returns:
+        int: Number of elements overridden in the active view
+    """
+    try:
+        set_overrides = active_view.SetElementOverrides
+        for element_id in element_ids:
+            set_overrides(element_id, override_settings)
+        applied_ids = element_ids
+    except Exception:
+        applied_ids = []
+        for element_id in element_ids:
+            try:
+                active_view.SetElementOverrides(element_id, override_settings)
+                applied_ids.append(element_id)
+            except Exception as e:
+                if len(failure_samples) < _FAILURE_SAMPLE_LIMIT:
+                    failure_samples.append((element_id.Value, str(e)))
+
+    # Optionally apply to other views of same type, one view at a time so
+    # the bound setter is resolved once per view
+    for view in other_views:
+        try:
+            set_overrides = view.SetElementOverrides
+            for element_id in applied_ids:
+                set_overrides(element_id, override_settings)
+        except Exception:
+            pass  # Don't fail if we can't apply to other views
+
+    return len(applied_ids)
+
+
 def generate_random_color():
     """
     Generate a random RGB color
@@ -427,28 +879,98 @@ def safe_float_conversion(value_str):
         float: Converted value or infinity for non-numeric values
     """
     if not value_str or value_str == "None":
-        return float("inf")  # Put "None" values at the end
+        return _INF  # Put "None" values at the end
+
+    value = _FLOAT_CACHE.get(value_str)
+    if value is not None:
+        return value
 
     try:
         # Handle unit suffixes like in script.py
         clean_value = str(value_str).strip()
+        match = _RE_NUMERIC_PREFIX.match(clean_value)
+        value = float(match.group(1) if match else clean_value)
+    except (ValueError, TypeError):
+        value = _INF  # Non-numeric values go to end
 
-        # Check if it has unit suffix (non-digit characters at the end)
-        suffix_index = 0
-        for char in reversed(clean_value):
-            if char.isdigit() or char == "." or char == "-" or char == "+":
-                break
-            suffix_index += 1
+    # "nan" and "inf" spellings are not numbers to sort by either
+    if value != value or value in (_INF, -_INF):
+        value = _INF
 
-        if suffix_index > 0:
-            # Remove unit suffix
-            numeric_part = clean_value[:-suffix_index]
-        else:
-            numeric_part = clean_value
+    if len(_FLOAT_CACHE) >= _FLOAT_CACHE_LIMIT:
+        _FLOAT_CACHE.clear()
+    _FLOAT_CACHE[value_str] = value
+    return value
 
-        return float(numeric_part)
-    except (ValueError, TypeError):
-        return float("inf")  # Non-numeric values go to end
+
+def _sorting_value_double(param, doc):
+    # Get both raw and display values
+    raw_value = param.AsDouble()
+    display_value = param.AsValueString() or str(raw_value)
+    return (raw_value, display_value)
+
+
+def _sorting_value_integer(param, doc):
+    # Handle Yes/No and regular integers
+    try:
+        if _is_yes_no(param.Definition):
+            bool_val = "True" if param.AsInteger() == 1 else "False"
+            return (bool_val, bool_val)
+
+        int_value = param.AsInteger()
+        display_value = param.AsValueString() or str(int_value)
+        return (int_value, display_value)
+    except:
+        int_value = param.AsInteger()
+        return (int_value, str(int_value))
+
+
+def _sorting_value_string(param, doc):
+    string_value = param.AsString() or "None"
+    return (string_value, string_value)
+
+
+def _sorting_value_element_id(param, doc):
+    id_val = param.AsElementId()
+    if id_val is not None and id_val != _INVALID_ELEMENT_ID:
+        # GetElement returns None for ids that no longer resolve
+        elem = doc.GetElement(id_val)
+        if elem is not None:
+            elem_name = getattr(elem, "Name", None) or "None"
+            return (elem_name, elem_name)
+    return ("None", "None")
+
+
+def _sorting_value_default(param, doc):
+    value_str = param.AsValueString() or "None"
+    return (value_str, value_str)
+
+
+# StorageType -> (raw_value, display_value) reader
+_SORTING_VALUE_READERS = {
+    _ST_DOUBLE: _sorting_value_double,
+    _ST_INTEGER: _sorting_value_integer,
+    _ST_STRING: _sorting_value_string,
+    _ST_ELEMENT_ID: _sorting_value_element_id,
+}
+
+
+def get_sorting_value_from_param(param, doc):
+    """
+    Get the (raw_value, display_value) pair of a parameter for sorting
+
+    Args:
+        param: Revit parameter
+        doc: Revit document, used to resolve ElementId values to names
+
+    Returns:
+        tuple: (raw_value, display_value) for sorting and display
+    """
+    if not param.HasValue:
+        return ("None", "None")
+
+    reader = _SORTING_VALUE_READERS.get(param.StorageType, _sorting_value_default)
+    return reader(param, doc)
 
 
 def get_parameter_value_for_sorting(element, parameter_name):
@@ -462,129 +984,23 @@ def get_parameter_value_for_sorting(element, parameter_name):
     Returns:
         tuple: (raw_value, display_value) for sorting and display
     """
+    if element is None:
+        return ("None", "None")
+
     try:
         # Try instance parameters first
-        for param in element.Parameters:
-            if param.Definition.Name == parameter_name:
-                if not param.HasValue:
-                    return ("None", "None")
-
-                if param.StorageType == DB.StorageType.Double:
-                    # Get both raw and display values
-                    raw_value = param.AsDouble()
-                    display_value = param.AsValueString() or str(raw_value)
-                    return (raw_value, display_value)
-
-                elif param.StorageType == DB.StorageType.Integer:
-                    # Handle Yes/No and regular integers
-                    try:
-                        if hasattr(param.Definition, "GetDataType"):
-                            param_type = param.Definition.GetDataType()
-                            if hasattr(DB, "SpecTypeId") and hasattr(
-                                DB.SpecTypeId, "Boolean"
-                            ):
-                                if param_type == DB.SpecTypeId.Boolean.YesNo:
-                                    bool_val = (
-                                        "True" if param.AsInteger() == 1 else "False"
-                                    )
-                                    return (bool_val, bool_val)
-                        elif hasattr(param.Definition, "ParameterType"):
-                            param_type = param.Definition.ParameterType
-                            if param_type == DB.ParameterType.YesNo:
-                                bool_val = "True" if param.AsInteger() == 1 else "False"
-                                return (bool_val, bool_val)
-
-                        int_value = param.AsInteger()
-                        display_value = param.AsValueString() or str(int_value)
-                        return (int_value, display_value)
-                    except:
-                        int_value = param.AsInteger()
-                        return (int_value, str(int_value))
-
-                elif param.StorageType == DB.StorageType.String:
-                    string_value = param.AsString() or "None"
-                    return (string_value, string_value)
-
-                elif param.StorageType == DB.StorageType.ElementId:
-                    id_val = param.AsElementId()
-                    if id_val and id_val != DB.ElementId.InvalidElementId:
-                        try:
-                            elem = element.Document.GetElement(id_val)
-                            if elem and hasattr(elem, "Name"):
-                                elem_name = elem.Name or "None"
-                                return (elem_name, elem_name)
-                        except:
-                            pass
-                    return ("None", "None")
-                else:
-                    value_str = param.AsValueString() or "None"
-                    return (value_str, value_str)
+        param = element.LookupParameter(parameter_name)
+        if param is not None:
+            return get_sorting_value_from_param(param, element.Document)
 
         # Try type parameters if not found in instance
-        try:
-            element_type = element.Document.GetElement(element.GetTypeId())
-            if element_type:
-                for param in element_type.Parameters:
-                    if param.Definition.Name == parameter_name:
-                        if not param.HasValue:
-                            return ("None", "None")
-
-                        if param.StorageType == DB.StorageType.Double:
-                            raw_value = param.AsDouble()
-                            display_value = param.AsValueString() or str(raw_value)
-                            return (raw_value, display_value)
-
-                        elif param.StorageType == DB.StorageType.Integer:
-                            try:
-                                if hasattr(param.Definition, "GetDataType"):
-                                    param_type = param.Definition.GetDataType()
-                                    if hasattr(DB, "SpecTypeId") and hasattr(
-                                        DB.SpecTypeId, "Boolean"
-                                    ):
-                                        if param_type == DB.SpecTypeId.Boolean.YesNo:
-                                            bool_val = (
-                                                "True"
-                                                if param.AsInteger() == 1
-                                                else "False"
-                                            )
-                                            return (bool_val, bool_val)
-                                elif hasattr(param.Definition, "ParameterType"):
-                                    param_type = param.Definition.ParameterType
-                                    if param_type == DB.ParameterType.YesNo:
-                                        bool_val = (
-                                            "True"
-                                            if param.AsInteger() == 1
-                                            else "False"
-                                        )
-                                        return (bool_val, bool_val)
-
-                                int_value = param.AsInteger()
-                                display_value = param.AsValueString() or str(int_value)
-                                return (int_value, display_value)
-                            except:
-                                int_value = param.AsInteger()
-                                return (int_value, str(int_value))
-
-                        elif param.StorageType == DB.StorageType.String:
-                            string_value = param.AsString() or "None"
-                            return (string_value, string_value)
-
-                        elif param.StorageType == DB.StorageType.ElementId:
-                            id_val = param.AsElementId()
-                            if id_val and id_val != DB.ElementId.InvalidElementId:
-                                try:
-                                    elem = element.Document.GetElement(id_val)
-                                    if elem and hasattr(elem, "Name"):
-                                        elem_name = elem.Name or "None"
-                                        return (elem_name, elem_name)
-                                except:
-                                    pass
-                            return ("None", "None")
-                        else:
-                            value_str = param.AsValueString() or "None"
-                            return (value_str, value_str)
-        except:
-            pass
+        type_id = element.GetTypeId()
+        if type_id != _INVALID_ELEMENT_ID:
+            element_type = element.Document.GetElement(type_id)
+            if element_type is not None:
+                param = element_type.LookupParameter(parameter_name)
+                if param is not None:
+                    return get_sorting_value_from_param(param, element.Document)
 
         return ("None", "None")
 
@@ -593,8 +1009,152 @@ def get_parameter_value_for_sorting(element, parameter_name):
         return ("None", "None")
 
 
+def make_parameter_finder(parameter_name):
+    """
+    Build a finder returning the named parameter for many elements
+
+    The parameter is resolved by name once; its instance and type
+    Definitions are then reused through get_Parameter, with a by-name
+    lookup only when an element does not carry that Definition. The
+    instance parameter takes precedence over the type parameter. Type
+    parameters, and types whose instances lack the name, are cached per
+    type id for the lifetime of the finder.
+
+    Args:
+        parameter_name (str): Name of the parameter
+
+    Returns:
+        function: find(element) -> instance or type parameter, or None
+    """
+    definitions = {}
+    type_params = {}  # type id value -> type parameter (or None)
+    instance_misses = set()  # type id values whose instances lack the name
+
+    def lookup(owner, scope):
+        definition = definitions.get(scope)
+        if definition is not None:
+            param = owner.get_Parameter(definition)
+            if param is not None:
+                return param
+        param = owner.LookupParameter(parameter_name)
+        if param is not None and definition is None:
+            definitions[scope] = param.Definition
+        return param
+
+    def find_type_param(element, type_id):
+        # Instances sharing a type share its parameter, so each type
+        # element is fetched and searched only once
+        type_key = type_id.Value
+        if type_key in type_params:
+            return type_params[type_key]
+
+        param = None
+        element_type = element.Document.GetElement(type_id)
+        if element_type:
+            param = lookup(element_type, "type")
+        type_params[type_key] = param
+        return param
+
+    def find(element):
+        try:
+            type_id = element.GetTypeId()
+
+            # Instances of one type carry the same instance parameters, so
+            # once one of them lacks the name the by-name lookup is skipped
+            # for the others
+            if type_id.Value not in instance_misses:
+                param = lookup(element, "instance")
+                if param is not None:
+                    return param
+                if type_id != _INVALID_ELEMENT_ID:
+                    instance_misses.add(type_id.Value)
+
+            try:
+                return find_type_param(element, type_id)
+            except:
+                pass
+
+            return None
+
+        except Exception as e:
+            logger.debug(
+                "Error getting parameter %s from element: %s", parameter_name, e
+            )
+            return None
+
+    return find
+
+
+def get_parameter_raw_key(param):
+    """
+    Get a cheap hashable key for the stored value of a parameter
+
+    Elements sharing a key share the same (raw_value, display_value), so
+    formatting can be done once per key instead of once per element.
+
+    Args:
+        param: Revit parameter, or None
+
+    Returns:
+        tuple: (storage tag, stored value), or None when there is no value
+    """
+    if param is None or not param.HasValue:
+        return None
+
+    storage_type = param.StorageType
+    if storage_type == _ST_DOUBLE:
+        return ("d", param.AsDouble())
+    elif storage_type == _ST_INTEGER:
+        return ("i", param.AsInteger())
+    elif storage_type == _ST_STRING:
+        return ("s", param.AsString())
+    elif storage_type == _ST_ELEMENT_ID:
+        return ("e", param.AsElementId().Value)
+    return ("v", param.AsValueString())
+
+
+def get_sort_key(raw_value, display_value):
+    """
+    Sorting key that orders numbers, then booleans, then text, then None
+
+    Args:
+        raw_value: Raw parameter value
+        display_value (str): Display value of the parameter
+
+    Returns:
+        tuple: (bucket, value) sort key
+    """
+    # Handle None values
+    if display_value == "None" or raw_value == "None":
+        return (2, 0)  # Put None at the end
+
+    # Handle boolean values
+    if display_value in ("True", "False"):
+        return (1, 0 if display_value == "False" else 1)
+
+    # Handle numeric values (int or float)
+    if isinstance(raw_value, (int, float)):
+        return (0, raw_value)
+
+    # Handle string values that might contain numbers
+    try:
+        numeric_sort_value = safe_float_conversion(display_value)
+        if numeric_sort_value != _INF:
+            return (0, numeric_sort_value)
+    except:
+        pass
+
+    # Fallback to string sorting
+    return (1.5, str(display_value).lower())
+
+
 def color_elements_by_parameter(
-    doc, category_name, parameter_name, use_gradient=False, custom_colors=None
+    doc,
+    category_name,
+    parameter_name,
+    use_gradient=False,
+    custom_colors=None,
+    apply_to_similar_views=False,
 ):
     """
     Color elements in a category based on parameter values with proper gradient support
@@ -605,19 +1165,15 @@ def color_elements_by_parameter(
         parameter_name (str): Name of the parameter to use for coloring
         use_gradient (bool): Whether to use gradient coloring
         custom_colors (list): Optional list of custom hex colors
+        apply_to_similar_views (bool): Also color the elements in every other
+            view of the active view's type
 
     Returns:
         dict: Results of the coloring operation
     """
     try:
         # Find the category
-        categories = doc.Settings.Categories
-        target_category = None
-
-        for cat in categories:
-            if cat.Name == category_name:
-                target_category = cat
-                break
+        target_category = find_category(doc, category_name)
 
         if not target_category:
             return {
@@ -625,112 +1181,115 @@ def color_elements_by_parameter(
                 "message": "Category '{}' not found".format(category_name),
             }
 
+        # Overrides would fail for every element in views that disallow them
+        active_view = doc.ActiveView
+        if not active_view.AreGraphicsOverridesAllowed():
+            return {
+                "status": "error",
+                "message": "Active view '{}' does not allow graphics overrides".format(
+                    active_view.Name
+                ),
+            }
+
         # Get elements from the category
         collector = (
             DB.FilteredElementCollector(doc)
             .OfCategoryId(target_category.Id)
             .WhereElementIsNotElementType()
         )
-        elements = collector.ToElements()
 
-        if not elements:
+        # Group elements by stored parameter value first, streaming the
+        # collector instead of materializing it with ToElements()
+        raw_groups = {}  # raw_key -> (sample parameter, elements)
+        element_count = 0
+
+        find_param = make_parameter_finder(parameter_name)
+        for element in collector:
+            element_count += 1
+            param = find_param(element)
+            try:
+                raw_key = get_parameter_raw_key(param)
+            except Exception as e:
+                logger.debug(
+                    "Error reading parameter %s from element: %s", parameter_name, e
+                )
+                raw_key = None
+
+            group = raw_groups.get(raw_key)
+            if group is None:
+                group = raw_groups[raw_key] = (param, [])
+            group[1].append(element)
+
+        if not element_count:
             return {
                 "status": "error",
                 "message": "No elements found in category '{}'".format(category_name),
             }
 
-        # Group elements by parameter value using improved method
+        # Format each distinct stored value once, then merge by display value
         parameter_groups = defaultdict(list)
         value_data = {}  # Store both raw and display values
+        sort_keys = {}
 
-        for element in elements:
-            raw_value, display_value = get_parameter_value_for_sorting(
-                element, parameter_name
-            )
+        for raw_key, (param, group_elements) in raw_groups.items():
+            raw_value, display_value = ("None", "None")
+            if raw_key is not None:
+                try:
+                    raw_value, display_value = get_sorting_value_from_param(param, doc)
+                except Exception as e:
+                    logger.debug("Error formatting parameter %s: %s", parameter_name, e)
 
             # Use display value as key for grouping
-            parameter_groups[display_value].append(element)
+            parameter_groups[display_value].extend(group_elements)
 
-            # Store raw value for sorting
+            # Store raw value and its sort key once per display value
             if display_value not in value_data:
                 value_data[display_value] = raw_value
-
-        # Sort values properly based on their type and content
-        def sort_key(display_value):
-            """Advanced sorting key that handles different data types"""
-            raw_value = value_data[display_value]
-
-            # Handle None values
-            if display_value == "None" or raw_value == "None":
-                return (2, 0)  # Put None at the end
-
-            # Handle boolean values
-            if display_value in ["True", "False"]:
-                return (1, 0 if display_value == "False" else 1)
-
-            # Handle numeric values (int or float)
-            if isinstance(raw_value, (int, float)):
-                return (0, raw_value)
-
-            # Handle string values that might contain numbers
-            try:
-                numeric_sort_value = safe_float_conversion(display_value)
-                if numeric_sort_value != float("inf"):
-                    return (0, numeric_sort_value)
-            except:
-                pass
-
-            # Fallback to string sorting
-            return (1.5, str(display_value).lower())
+                sort_keys[display_value] = get_sort_key(raw_value, display_value)
 
         # Check for numeric gradient mode
+        parameter_name_lower = parameter_name.lower()
         is_numeric_gradient = use_gradient and any(
-            param_name.lower() in parameter_name.lower()
-            for param_name in [
-                "length",
-                "longueur",
-                "area",
-                "volume",
-                "height",
-                "width",
-                "thickness",
-            ]
+            hint in parameter_name_lower for hint in _NUMERIC_PARAM_HINTS
         )
 
         if is_numeric_gradient:
             # For numeric parameters in gradient mode, treat each unique value individually
             # but still group elements with identical values
-            unique_values = sorted(parameter_groups.keys(), key=sort_key)
+            unique_values = sorted(parameter_groups, key=sort_keys.__getitem__)
             value_count = len(unique_values)
 
             # Create mapping from value to position in gradient
             value_positions = {}
-            numeric_values = []
+            min_val = max_val = None
 
+            # Single pass min/max over the numeric raw values
             for display_value in unique_values:
                 raw_value = value_data[display_value]
                 if isinstance(raw_value, (int, float)):
-                    numeric_values.append(raw_value)
+                    if min_val is None:
+                        min_val = max_val = raw_value
+                    elif raw_value < min_val:
+                        min_val = raw_value
+                    elif raw_value > max_val:
+                        max_val = raw_value
 
-            if numeric_values:
-                min_val = min(numeric_values)
-                max_val = max(numeric_values)
+            if min_val is not None:
+                span = float(max_val - min_val)
 
                 for display_value in unique_values:
                     raw_value = value_data[display_value]
-                    if isinstance(raw_value, (int, float)) and max_val != min_val:
-                        position = (raw_value - min_val) / (max_val - min_val)
-                        value_positions[display_value] = position
+                    if isinstance(raw_value, (int, float)) and span:
+                        value_positions[display_value] = (raw_value - min_val) / span
                     else:
                         value_positions[display_value] = 0.5
             else:
                 # Fallback if no numeric values
+                last_index = float(max(1, value_count - 1))
                 for i, display_value in enumerate(unique_values):
-                    value_positions[display_value] = float(i) / max(
-                        1, len(unique_values) - 1
-                    )
+                    value_positions[display_value] = i / last_index
         else:
-            unique_values = sorted(parameter_groups.keys(), key=sort_key)
+            unique_values = sorted(parameter_groups, key=sort_keys.__getitem__)
             value_count = len(unique_values)
 
         logger.info(
@@ -755,11 +1314,10 @@ def color_elements_by_parameter(
 
         elif use_gradient and is_numeric_gradient:
             # Use interpolated colors for numeric gradients
-            colors = []
-            for param_value in unique_values:
-                position = value_positions.get(param_value, 0.5)
-                color = interpolate_color(position)
-                colors.append(color)
+            colors = [
+                interpolate_color(value_positions.get(param_value, 0.5))
+                for param_value in unique_values
+            ]
         elif use_gradient:
             # Generate proper gradient colors for non-numeric
             colors = generate_gradient_colors(value_count)
@@ -767,96 +1325,84 @@ def color_elements_by_parameter(
             # Use distinct colors
             colors = generate_distinct_colors(value_count)
 
-        # Apply colors to elements
+        # Resolve colors and override settings per group before the
+        # transaction so it only has to apply overrides
         color_assignments = {}
-        elements_colored = 0
-        solid_fill_id = solid_fill_pattern_id(doc)
+        group_overrides = []
+        override_template = build_override_template(solid_fill_pattern_id(doc))
+        override_cache = {}
+
+        # Ensure we have enough colors
+        if len(colors) < value_count:
+            logger.warning(
+                "Not enough colors generated. Expected %d, got %d",
+                value_count,
+                len(colors),
+            )
+            additional_needed = value_count - len(colors)
+            additional_colors = generate_distinct_colors(additional_needed)
+            colors.extend(additional_colors)
 
-        with DB.Transaction(doc, "Color Elements by Parameter") as t:
-            t.Start()
+        for i, param_value in enumerate(unique_values):
+            group_elements = parameter_groups[param_value]
 
-            # Ensure we have enough colors
-            if len(colors) < value_count:
+            # Get color for this group
+            if i < len(colors):
+                color = colors[i]
+            else:
                 logger.warning(
-                    "Not enough colors generated. Expected %d, got %d",
-                    value_count,
-                    len(colors),
+                    "Color index out of bounds for value %s at index %d",
+                    param_value,
+                    i,
                 )
-                additional_needed = value_count - len(colors)
-                additional_colors = generate_distinct_colors(additional_needed)
-                colors.extend(additional_colors)
-
-            for i, param_value in enumerate(unique_values):
-                group_elements = parameter_groups[param_value]
+                rgb = generate_random_color()
+                color = DB.Color(rgb[0], rgb[1], rgb[2])
+
+            hex_color = safe_color_to_hex(color)
+            color_assignments[param_value] = {
+                "color": hex_color,
+                "element_count": len(group_elements),
+                "sort_index": i,  # Add sort index for debugging
+            }
 
-                # Get color for this group
-                if i < len(colors):
-                    color = colors[i]
-                else:
-                    logger.warning(
-                        "Color index out of bounds for value %s at index %d",
-                        param_value,
-                        i,
-                    )
-                    rgb = generate_random_color()
-                    color = DB.Color(rgb[0], rgb[1], rgb[2])
+            # Groups sharing a color (e.g. repeated custom colors) share
+            # one override settings object
+            override_settings = override_cache.get(hex_color)
+            if override_settings is None:
+                override_settings = build_color_override(color, override_template)
+                override_cache[hex_color] = override_settings
 
-                color_assignments[param_value] = {
-                    "color": safe_color_to_hex(color),
-                    "element_count": len(group_elements),
-                    "sort_index": i,  # Add sort index for debugging
-                }
+            group_overrides.append((group_elements, override_settings))
 
-                # Apply color override to each element with improved settings
-                override_settings = DB.OverrideGraphicSettings()
-                override_settings.SetProjectionLineColor(color)
-                override_settings.SetSurfaceForegroundPatternColor(color)
-                override_settings.SetCutForegroundPatternColor(color)
-                override_settings.SetCutLineColor(color)
-                override_settings.SetProjectionLineWeight(3)  # Make lines more visible
+        # Apply colors to elements
+        elements_colored = 0
+        failure_samples = []
+        other_views = (
+            get_views_of_same_type(doc, active_view) if apply_to_similar_views else []
+        )
 
-                if solid_fill_id is not None:
-                    override_settings.SetSurfaceForegroundPatternId(solid_fill_id)
-                    override_settings.SetCutForegroundPatternId(solid_fill_id)
+        with DB.Transaction(doc, "Color Elements by Parameter") as t:
+            t.Start()
 
-                for element in group_elements:
-                    try:
-                        # Apply to active view first (CRITICAL FIX!)
-                        active_view = doc.ActiveView
-                        active_view.SetElementOverrides(element.Id, override_settings)
-                        elements_colored += 1
-
-                        # Optionally apply to other views of same type
-                        try:
-                            if hasattr(active_view, "ViewType"):
-                                view_type = active_view.ViewType
-                                other_views = (
-                                    DB.FilteredElementCollector(doc)
-                                    .OfClass(DB.View)
-                                    .WhereElementIsNotElementType()
-                                )
-                                for view in other_views:
-                                    if (
-                                        not view.IsTemplate
-                                        and hasattr(view, "ViewType")
-                                        and view.ViewType == view_type
-                                        and view.Id != active_view.Id
-                                    ):
-                                        view.SetElementOverrides(
-                                            element.Id, override_settings
-                                        )
-                        except Exception:
-                            pass  # Don't fail if we can't apply to other views
-
-                    except Exception as e:
-                        logger.warning(
-                            "Failed to color element %s: %s",
-                            element.Id.Value,
-                            e,
-                        )
+            for group_elements, override_settings in group_overrides:
+                elements_colored += apply_element_overrides(
+                    active_view,
+                    other_views,
+                    [element.Id for element in group_elements],
+                    override_settings,
+                    failure_samples,
+                )
 
             t.Commit()
 
+        if elements_colored < element_count:
+            logger.warning(
+                "Failed to color %d elements; first %d: %s",
+                element_count - elements_colored,
+                len(failure_samples),
+                failure_samples,
+            )
+
         result = {
             "status": "success",
             "message": "Successfully colored {} elements in {} color groups".format(
@@ -866,7 +1412,7 @@ def color_elements_by_parameter(
             "parameter": parameter_name,
             "color_assignments": color_assignments,
             "statistics": {
-                "total_elements": len(elements),
+                "total_elements": element_count,
                 "elements_colored": elements_colored,
                 "unique_parameter_values": value_count,
                 "use_gradient": use_gradient,
@@ -889,26 +1435,22 @@ def color_elements_by_parameter(
         }
 
 
-def clear_element_colors(doc, category_name):
+def clear_element_colors(doc, category_name, apply_to_similar_views=False):
     """
     Clear color overrides for elements in a category
 
     Args:
         doc: Revit document
         category_name (str): Name of the category to clear colors from
+        apply_to_similar_views (bool): Also clear the elements in every other
+            view of the active view's type
 
     Returns:
         dict: Results of the clear operation
     """
     try:
         # Find the category
-        categories = doc.Settings.Categories
-        target_category = None
-
-        for cat in categories:
-            if cat.Name == category_name:
-                target_category = cat
-                break
+        target_category = find_category(doc, category_name)
 
         if not target_category:
             return {
@@ -916,63 +1458,67 @@ def clear_element_colors(doc, category_name):
                 "message": "Category '{}' not found".format(category_name),
             }
 
+        # Overrides would fail for every element in views that disallow them
+        active_view = doc.ActiveView
+        if not active_view.AreGraphicsOverridesAllowed():
+            return {
+                "status": "error",
+                "message": "Active view '{}' does not allow graphics overrides".format(
+                    active_view.Name
+                ),
+            }
+
         # Get elements from the category
         collector = (
             DB.FilteredElementCollector(doc)
             .OfCategoryId(target_category.Id)
             .WhereElementIsNotElementType()
         )
-        elements = collector.ToElements()
+        # Only ids are needed to clear overrides
+        element_ids = list(collector.ToElementIds())
 
-        if not elements:
+        if not element_ids:
             return {
                 "status": "warning",
                 "message": "No elements found in category '{}'".format(category_name),
             }
 
-        elements_cleared = 0
-
-        # Get active view for clearing overrides
-        active_view = doc.ActiveView
-
-        with DB.Transaction(doc, "Clear Element Colors") as t:
-            t.Start()
-
-            # Clear overrides for each element in active view
-            for element in elements:
-                try:
-                    empty_override = DB.OverrideGraphicSettings()
-                    active_view.SetElementOverrides(element.Id, empty_override)
-                    elements_cleared += 1
+        # Get views of the active view's type for clearing overrides
+        other_views = (
+            get_views_of_same_type(doc, active_view) if apply_to_similar_views else []
+        )
 
-                    # Optionally clear from other views of same type
-                    try:
-                        if hasattr(active_view, "ViewType"):
-                            view_type = active_view.ViewType
-                            other_views = (
-                                DB.FilteredElementCollector(doc)
-                                .OfClass(DB.View)
-                                .WhereElementIsNotElementType()
-                            )
-                            for view in other_views:
-                                if (
-                                    not view.IsTemplate
-                                    and hasattr(view, "ViewType")
-                                    and view.ViewType == view_type
-                                    and view.Id != active_view.Id
-                                ):
-                                    view.SetElementOverrides(element.Id, empty_override)
-                    except Exception:
-                        pass  # Don't fail if we can't clear from other views
+        # One empty override clears every element
+        empty_override = DB.OverrideGraphicSettings()
+        failure_samples = []
+        elements_cleared = 0
 
-                except Exception as e:
-                    logger.warning(
-                        "Failed to clear colors for element %s: %s",
-                        element.Id.Value,
-                        e,
+        # Commit in batches so large categories do not build one huge
+        # transaction; assimilating the group keeps a single undo step
+        with DB.TransactionGroup(doc, "Clear Element Colors") as tg:
+            tg.Start()
+
+            for start in range(0, len(element_ids), _CLEAR_BATCH_SIZE):
+                with DB.Transaction(doc, "Clear Element Colors") as t:
+                    t.Start()
+                    elements_cleared += apply_element_overrides(
+                        active_view,
+                        other_views,
+                        element_ids[start : start + _CLEAR_BATCH_SIZE],
+                        empty_override,
+                        failure_samples,
                     )
+                    t.Commit()
 
-            t.Commit()
+            tg.Assimilate()
+
+        if elements_cleared < len(element_ids):
+            logger.warning(
+                "Failed to clear colors for %d elements; first %d: %s",
+                len(element_ids) - elements_cleared,
+                len(failure_samples),
+                failure_samples,
+            )
 
         return {
             "status": "success",
@@ -991,6 +1537,26 @@ def clear_element_colors(doc, category_name):
         }
 
 
+def _read_sample_value(param, doc):
+    """
+    Read a JSON-safe sample value from a parameter that has a value
+
+    Args:
+        param: Revit parameter
+        doc: Revit document, used to resolve ElementId values to names
+
+    Returns:
+        str: Cleaned display value, or "None" if it cannot be read
+    """
+    try:
+        return clean_parameter_value_for_json(
+            get_sorting_value_from_param(param, doc)[1]
+        )
+    except Exception as e:
+        logger.debug("Error reading parameter %s: %s", param.Definition.Name, e)
+        return "None"
+
+
 def list_category_parameters(doc, category_name):
     """
     Get available parameters for elements in a category
@@ -1004,13 +1570,7 @@ def list_category_parameters(doc, category_name):
     """
     try:
         # Find the category
-        categories = doc.Settings.Categories
-        target_category = None
-
-        for cat in categories:
-            if cat.Name == category_name:
-                target_category = cat
-                break
+        target_category = find_category(doc, category_name)
 
         if not target_category:
             return {
@@ -1024,45 +1584,36 @@ def list_category_parameters(doc, category_name):
             .OfCategoryId(target_category.Id)
             .WhereElementIsNotElementType()
         )
-        elements = collector.ToElements()
+        sample_element = collector.FirstElement()
 
-        if not elements:
+        if sample_element is None:
             return {
                 "status": "error",
                 "message": "No elements found in category '{}'".format(category_name),
             }
 
         # Get parameters from the first element
-        sample_element = elements[0]
         parameters = []
 
         # Get all parameters
         for param in sample_element.Parameters:
-            try:
-                param_name = param.Definition.Name
-                storage_type = str(param.StorageType)
-                has_value = param.HasValue
-
-                # Get a sample value if available (JSON-safe)
-                sample_value = "N/A"
-                if has_value:
-                    sample_value = get_parameter_value_json_safe(
-                        sample_element, param_name
-                    )
-
-                parameters.append(
-                    {
-                        "name": param_name,
-                        "storage_type": storage_type,
-                        "has_value": has_value,
-                        "sample_value": sample_value,
-                    }
-                )
-
-            except Exception as e:
-                logger.debug("Error processing parameter: %s", e)
+            definition = param.Definition
+            if definition is None:
                 continue
 
+            has_value = param.HasValue
+            parameters.append(
+                {
+                    "name": definition.Name,
+                    "storage_type": str(param.StorageType),
+                    "has_value": has_value,
+                    # JSON-safe sample read from the parameter already in hand
+                    "sample_value": (
+                        _read_sample_value(param, doc) if has_value else "N/A"
+                    ),
+                }
+            )
+
         # Sort parameters by name for easier reading
         parameters.sort(key=lambda x: x["name"])
 
@@ -1081,9 +1632,18 @@ def list_category_parameters(doc, category_name):
         }
 
 
+def _parse_json(request):
+    """Get the request body as a dict, decoding it if it arrived as a string"""
+    data = request.data
+    return json.loads(data) if isinstance(data, str) else data
+
+
 def register_color_routes(api):
     """Register color-related routes with the API"""
 
+    # Attached on every load; a reload replaces the previous handlers
+    _watch_document_events(HOST_APP.app)
+
     @api.route("/color_splash/", methods=["POST"])
     @api.route("/color_splash", methods=["POST"])
     def color_splash(doc, request):
@@ -1095,20 +1655,18 @@ def register_color_routes(api):
             "category_name": "Walls",
             "parameter_name": "Mark",
             "use_gradient": false,
-            "custom_colors": ["#FF0000", "#00FF00", "#0000FF"]  // optional
+            "custom_colors": ["#FF0000", "#00FF00", "#0000FF"],  // optional
+            "apply_to_similar_views": false  // optional
         }
         """
         try:
-            data = (
-                json.loads(request.data)
-                if isinstance(request.data, str)
-                else request.data
-            )
+            data = _parse_json(request)
 
             category_name = data.get("category_name")
             parameter_name = data.get("parameter_name")
             use_gradient = data.get("use_gradient", False)
             custom_colors = data.get("custom_colors", None)
+            apply_to_similar_views = data.get("apply_to_similar_views", False)
 
             if not category_name or not parameter_name:
                 return routes.make_response(
@@ -1117,7 +1675,12 @@ def register_color_routes(api):
                 )
 
             result = color_elements_by_parameter(
-                doc, category_name, parameter_name, use_gradient, custom_colors
+                doc,
+                category_name,
+                parameter_name,
+                use_gradient,
+                custom_colors,
+                apply_to_similar_views,
             )
 
             return routes.make_response(data=result, status=200)
@@ -1134,24 +1697,22 @@ def register_color_routes(api):
 
         Expected JSON payload:
         {
-            "category_name": "Walls"
+            "category_name": "Walls",
+            "apply_to_similar_views": false  // optional
         }
         """
         try:
-            data = (
-                json.loads(request.data)
-                if isinstance(request.data, str)
-                else request.data
-            )
+            data = _parse_json(request)
 
             category_name = data.get("category_name")
+            apply_to_similar_views = data.get("apply_to_similar_views", False)
 
             if not category_name:
                 return routes.make_response(
                     data={"error": "category_name is required"}, status=400
                 )
 
-            result = clear_element_colors(doc, category_name)
+            result = clear_element_colors(doc, category_name, apply_to_similar_views)
 
             return routes.make_response(data=result, status=200)
 
@@ -1171,11 +1732,7 @@ def register_color_routes(api):
         }
         """
         try:
-            data = (
-                json.loads(request.data)
-                if isinstance(request.data, str)
-                else request.data
-            )
+            data = _parse_json(request)
 
             category_name = data.get("category_name")
 
@@ -1204,9 +1761,9 @@ def get_numeric_parameter_raw_value(param):
         float: Raw numeric value, or None if not available
     """
     try:
-        if param.StorageType == DB.StorageType.Double:
+        if param.StorageType == _ST_DOUBLE:
             return param.AsDouble()
-        elif param.StorageType == DB.StorageType.Integer:
+        elif param.StorageType == _ST_INTEGER:
             return float(param.AsInteger())
         else:
             return None
@@ -1228,16 +1785,18 @@ def format_numeric_for_json(value):
         if value is None:
             return "None"
 
+        magnitude = abs(value)
+
         # Handle very small values as zero
-        if abs(value) < 1e-10:
+        if magnitude < 1e-10:
             return "0.000"
 
         # Handle very large values
-        if abs(value) > 1e10:
-            return "{:.2e}".format(value)
+        if magnitude > 1e10:
+            return format(value, ".2e")
 
         # Normal values - use reasonable precision
-        return "{:.3f}".format(value)
+        return format(value, ".3f")
 
     except Exception:
         return "None"
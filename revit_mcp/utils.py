@@ -15,6 +15,7 @@ import clr
 from Autodesk.Revit.DB import (
     IFailuresPreprocessor, 
     FailureProcessingResult, 
+    FailureSeverity,
     BuiltInFailures
 )
 
@@ -133,6 +134,43 @@ class ExtendedRoomWarningSwallower(IFailuresPreprocessor):
             return FailureProcessingResult.Continue
 
 
+class WarningSwallower(IFailuresPreprocessor):
+    """
+    Failure preprocessor that dismisses every warning-level failure.
+    
+    Meant for batch operations (e.g. beam layouts) where each created element
+    can raise its own warning and Revit would otherwise stop to report them.
+    Errors are left untouched so they still roll the transaction back.
+    
+    Usage:
+        options = transaction.GetFailureHandlingOptions()
+        options.SetFailuresPreprocessor(WarningSwallower())
+        transaction.SetFailureHandlingOptions(options)
+    """
+    
+    def PreprocessFailures(self, failures_accessor):
+        """
+        Deletes all warnings reported during the transaction.
+        
+        Args:
+            failures_accessor: FailuresAccessor object containing failure messages
+            
+        Returns:
+            FailureProcessingResult.Continue to continue processing
+        """
+        try:
+            for failure in failures_accessor.GetFailureMessages():
+                if failure.GetSeverity() == FailureSeverity.Warning:
+                    failures_accessor.DeleteWarning(failure)
+            
+            return FailureProcessingResult.Continue
+            
+        except Exception as e:
+            # Log error but continue processing to avoid breaking the workflow
+            print("Error in WarningSwallower: {}".format(str(e)))
+            return FailureProcessingResult.Continue
+
+
 # Utility functions for easier usage
 def create_room_warning_swallower():
     """
@@ -232,12 +270,14 @@ def get_element_name(element):
         return DB.Element.Name.__get__(element)
 
 
-def find_family_symbol_safely(doc, target_family_name, target_type_name=None):
+def find_family_symbol_safely(doc, target_family_name, target_type_name=None, category=None):
     """
-    Safely find a family symbol by name
+    Safely find a family symbol by name, optionally restricted to a BuiltInCategory
     """
     try:
         collector = DB.FilteredElementCollector(doc).OfClass(DB.FamilySymbol)
+        if category is not None:
+            collector = collector.OfCategory(category)
 
         for symbol in collector:
             if symbol.Family.Name == target_family_name:
@@ -271,7 +271,11 @@ def register_beam_tools(mcp, revit_get, revit_post):
 
     
     @mcp.tool()
-    async def get_beam_details(ctx: Context = None) -> str:
+    async def get_beam_details(
+        include_bbox: bool = False,
+        include_type_properties: bool = True,
+        ctx: Context = None
+    ) -> str:
         """
         Get comprehensive information about selected structural beam elements in Revit
 
@@ -287,12 +291,16 @@ def register_beam_tools(mcp, revit_get, revit_post):
         - Level information (name, ID, elevation) and height offsets
         - Structural usage and material assignments
         - Key parameters (Mark, Comments, Phasing, etc.)
-        - Bounding box dimensions and positioning
+        - Bounding box dimensions and positioning (only when include_bbox is True)
 
         All measurements are converted to metric units (mm for lengths, MPa for stresses,
         kg/m³ for densities, etc.).
 
         Args:
+            include_bbox: Include each beam's bounding box (default: False). Computing
+                bounding boxes is expensive, so only request them when needed.
+            include_type_properties: Include the detailed type_properties breakdown
+                (default: True). Set to False for a faster, lighter response.
             ctx: MCP context for logging
 
         Returns:
@@ -304,7 +312,7 @@ def register_beam_tools(mcp, revit_get, revit_post):
             - beams_found: Number of beam elements found
             - beams: Array of detailed beam information with:
                 - Basic info (ID, name, family, type)
-                - Comprehensive type_properties:
+                - Comprehensive type_properties (when include_type_properties is True):
                     - dimensions: Section properties (d, bf, tf, tw, area, Ix, Iy, etc.)
                     - materials: Material assignments with detailed properties
                     - structural: Structural usage, strength values, modulus
@@ -315,7 +323,8 @@ def register_beam_tools(mcp, revit_get, revit_post):
                 - level: Level information and offsets
                 - structural_properties: Usage and material data
                 - parameters: Instance parameters
-                - bounding_box: Element bounds
+                - bounding_box: Element bounds (when include_bbox is True)
+            Sections with no data for a beam are omitted rather than returned empty.
 
         This is useful for analyzing selected beams, getting their comprehensive properties,
         understanding their structural characteristics, and extracting data for analysis,
@@ -334,7 +343,12 @@ def register_beam_tools(mcp, revit_get, revit_post):
             if ctx:
                 await ctx.info("Getting detailed information about selected beams...")
 
-            response = await revit_get("/get_beam_details/", ctx)
+            response = await revit_get(
+                "/get_beam_details/?include_bbox={}&include_type_properties={}".format(
+                    str(include_bbox).lower(), str(include_type_properties).lower()
+                ),
+                ctx
+            )
             return format_response(response)
 
         except Exception as e:
@@ -347,11 +361,16 @@ def register_beam_tools(mcp, revit_get, revit_post):
     @mcp.tool()
     async def create_beam_layout(
         level_name: str,
-        beam_configs: list,
+        beam_configs: list = None,
         layout_type: str = "custom",
         family_name: str = "W-Wide Flange",
         structural_usage: str = "Beam",
         naming_pattern: str = "B{}",
+        x_positions: list = None,
+        y_positions: list = None,
+        z_level: float = 0.0,
+        type_name: str = None,
+        verbose: bool = False,
         ctx: Context = None
     ) -> str:
         """
@@ -362,7 +381,7 @@ def register_beam_tools(mcp, revit_get, revit_post):
 
         Args:
             level_name: Name of the target level for all beams (required)
-            beam_configs: Array of beam configurations, each containing:
+            beam_configs: Array of beam configurations (required unless a grid is given), each containing:
                 - start_point: Start coordinates {"x": 0, "y": 0, "z": 3000}
                 - end_point: End coordinates {"x": 5000, "y": 0, "z": 3000}
                 - type_name: Beam type (optional, uses family default)
@@ -372,6 +391,11 @@ def register_beam_tools(mcp, revit_get, revit_post):
             family_name: Default beam family for all beams (default: "W-Wide Flange")
             structural_usage: Default structural usage for all beams (default: "Beam")
             naming_pattern: Pattern for auto-naming beams with {} placeholder (default: "B{}")
+            x_positions: Grid line X positions in mm (grid layout only, optional)
+            y_positions: Grid line Y positions in mm (grid layout only, optional)
+            z_level: Elevation of grid beams in mm (grid layout only, default: 0.0)
+            type_name: Beam type for every grid beam (grid layout only, optional)
+            verbose: Return full details per beam instead of element_id and length (default: False)
             ctx: MCP context for logging
 
         Returns:
@@ -381,7 +405,8 @@ def register_beam_tools(mcp, revit_get, revit_post):
             - message: Summary of creation results
             - created_count: Number of successfully created beams
             - requested_count: Total number of beams requested
-            - beams: Array of created beam details
+            - beams: Array of created beams, each with element_id and length
+              (plus family, type and message when verbose is True)
 
         Examples:
             # Create a simple beam layout
@@ -424,20 +449,43 @@ def register_beam_tools(mcp, revit_get, revit_post):
                 layout_type="custom",
                 structural_usage="Beam"
             )
+
+            # Create a 3x2 bay grid of beams without listing each one
+            create_beam_layout(
+                level_name="Level 1",
+                layout_type="grid",
+                x_positions=[0, 6000, 12000, 18000],
+                y_positions=[0, 8000, 16000],
+                z_level=3000,
+                type_name="W12X26"
+            )
         """
         try:
+            is_grid = layout_type == "grid" and x_positions and y_positions
             if ctx:
-                await ctx.info("Creating beam layout with {} beams...".format(len(beam_configs)))
+                if is_grid:
+                    await ctx.info("Creating beam grid on {} x {} lines...".format(
+                        len(x_positions), len(y_positions)))
+                else:
+                    await ctx.info("Creating beam layout with {} beams...".format(len(beam_configs or [])))
 
             # Prepare request data
             request_data = {
                 "level_name": level_name,
-                "beam_configs": beam_configs,
                 "layout_type": layout_type,
                 "family_name": family_name,
                 "structural_usage": structural_usage,
-                "naming_pattern": naming_pattern
+                "naming_pattern": naming_pattern,
+                "verbose": verbose
             }
+            if is_grid:
+                request_data["x_positions"] = x_positions
+                request_data["y_positions"] = y_positions
+                request_data["z_level"] = z_level
+                if type_name:
+                    request_data["type_name"] = type_name
+            else:
+                request_data["beam_configs"] = beam_configs
 
             response = await revit_post("/create_beam_layout/", request_data, ctx)
             return format_response(response)
@@ -15,6 +15,7 @@ def register_colors_tools(mcp, revit_get, revit_post, revit_image=None):
         parameter_name: str,
         use_gradient: bool = False,
         custom_colors: Optional[List[str]] = None,
+        apply_to_similar_views: bool = False,
         ctx: Context = None,
     ) -> str:
         """
@@ -29,6 +30,7 @@ def register_colors_tools(mcp, revit_get, revit_post, revit_image=None):
             parameter_name: Name of the parameter to use for coloring (e.g., "Mark", "Type Name")
             use_gradient: Whether to use gradient coloring instead of distinct colors (default: False)
             custom_colors: Optional list of custom colors in hex format (e.g., ["#FF0000", "#00FF00"])
+            apply_to_similar_views: Also color the elements in every other view of the active view's type (default: False)
             ctx: MCP context for logging
 
         Returns:
@@ -39,6 +41,7 @@ def register_colors_tools(mcp, revit_get, revit_post, revit_image=None):
                 "category_name": category_name,
                 "parameter_name": parameter_name,
                 "use_gradient": use_gradient,
+                "apply_to_similar_views": apply_to_similar_views,
             }
 
             if custom_colors:
@@ -58,7 +61,9 @@ def register_colors_tools(mcp, revit_get, revit_post, revit_image=None):
             return error_msg
 
     @mcp.tool()
-    async def clear_colors(category_name: str, ctx: Context = None) -> str:
+    async def clear_colors(
+        category_name: str, apply_to_similar_views: bool = False, ctx: Context = None
+    ) -> str:
         """
         Clear color overrides for elements in a category
 
@@ -67,13 +72,17 @@ def register_colors_tools(mcp, revit_get, revit_post, revit_image=None):
 
         Args:
             category_name: Name of the category to clear colors from (e.g., "Walls", "Doors")
+            apply_to_similar_views: Also clear the elements in every other view of the active view's type (default: False)
             ctx: MCP context for logging
 
         Returns:
             Results of the clear operation including count of elements processed
         """
         try:
-            data = {"category_name": category_name}
+            data = {
+                "category_name": category_name,
+                "apply_to_similar_views": apply_to_similar_views,
+            }
 
             await ctx.info("Clearing color overrides for {} elements".format(category_name))
             response = await revit_post("/clear_colors/", data, ctx)